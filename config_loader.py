@@ -1,10 +1,12 @@
+import copy
 import os
 import sys
 import yaml
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
 
 
 @dataclass
@@ -80,15 +82,56 @@ class AppConfig:
     agent_config: AgentConfig
 
 
+# Umgebungsvariablen, die in die Konfiguration einfließen - ihr Wert ist Teil des
+# Cache-Keys, ein später exportierter Key wird daher nicht vom Cache verdeckt
+CONFIG_ENV_VARS = ('MINIMAX_API_KEY',)
+
+
+def _config_stamp(config_path: str, dotenv_path: str) -> tuple:
+    """
+    (Pfad, mtime) für config_path und die .env; fehlende Dateien zählen als 0.
+
+    Jede Datei geht einzeln in den Cache-Key ein (kein max()): auch eine
+    wiederhergestellte ältere oder gelöschte Datei invalidiert den Cache.
+    """
+    stamp = []
+    for path in (config_path, dotenv_path):
+        if not path:
+            continue
+        try:
+            stamp.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            stamp.append((path, 0))
+    return tuple(stamp)
+
+
 def load_configuration(config_path: str = 'config.yaml') -> AppConfig:
     """
     Lädt die vollständige SelfAI-Konfiguration aus einer YAML-Datei und Umgebungsvariablen.
+
+    Das Ergebnis wird gecacht - wiederholte Aufrufe parsen .env und YAML nicht neu.
+    Ändert sich config_path oder .env (mtime) oder eine der CONFIG_ENV_VARS, wird
+    neu geladen. Jeder Aufruf erhält eine eigene Kopie, Änderungen am Ergebnis
+    wirken sich nicht auf andere Aufrufer aus.
     
     KRITISCH: Gibt AppConfig zurück, nicht nur MiniMaxConfig!
     Enthält ALLE Sub-Configs für DPPM (Distributed Planning Problem Model).
     """
-    # .env-Datei für Geheimnisse laden
-    load_dotenv()
+    # Dieselbe .env, die load_dotenv() ohne Argument laden würde (Suche ab
+    # diesem Modul aufwärts, nicht relativ zum Arbeitsverzeichnis)
+    dotenv_path = find_dotenv()
+    env = tuple(os.environ.get(name) for name in CONFIG_ENV_VARS)
+    stamp = _config_stamp(config_path, dotenv_path)
+    config = _load_configuration_cached(config_path, dotenv_path, stamp, env)
+    return copy.deepcopy(config)
+
+
+@lru_cache(maxsize=1)
+def _load_configuration_cached(config_path: str, dotenv_path: str, stamp: tuple, env: tuple) -> AppConfig:
+    """Eigentliches Laden; ``stamp`` und ``env`` sind Teil des Cache-Keys und invalidieren bei Änderungen."""
+    # .env-Datei für Geheimnisse laden - genau die überwachte Datei
+    if dotenv_path:
+        load_dotenv(dotenv_path)
 
     # Fallback-Konfiguration wenn config.yaml fehlt
     if not os.path.exists(config_path):
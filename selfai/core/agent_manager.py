@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -20,6 +21,11 @@ class Agent:
     tags: list[str] = field(default_factory=list)
     path: Optional[Path] = None
 
+    @cached_property
+    def memory_categories_label(self) -> str:
+        """Kommagetrennte Memory-Kategorien für Anzeigen ("-" wenn keine)."""
+        return ", ".join(self.memory_categories) or "-"
+
 
 class AgentManager:
     def __init__(self, agents_dir: Path, verbose: bool = False):
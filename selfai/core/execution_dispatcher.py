@@ -492,6 +492,7 @@ class ExecutionDispatcher:
                             self.multi_pane_ui.update_pane(task_id, think_buffer.strip())
 
                         if not use_parallel_ui and not use_multi_pane:
+                            self.ui.flush_stream()
                             print()
                         return "".join(chunks)
                     except Exception as stream_exc:
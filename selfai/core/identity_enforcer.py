@@ -151,6 +151,23 @@ class IdentityGuardrail:
         (r"[Aa]ls künstliche[r]? Intelligenz", "Als SelfAI"),
     ]
 
+    # Einmal kompiliert: je Pattern ein Regex plus eine Alternation über alle.
+    # Die Alternation liefert in einem Durchlauf alle Startpositionen möglicher
+    # Leaks, nur dort werden die Einzel-Patterns verankert geprüft (_scan).
+    _LEAK_REGEXES = [(re.compile(pattern), description) for pattern, description in LEAK_PATTERNS]
+    _ANY_LEAK = re.compile("|".join(f"(?:{pattern})" for pattern, _ in LEAK_PATTERNS))
+    _CORRECTION_REGEXES = [(re.compile(pattern), replacement) for pattern, replacement in CORRECTIONS]
+    # Think-Blöcke (auch noch offene) werden beim Streaming nicht geprüft
+    _THINK_BLOCK = re.compile(r"<think>.*?(?:</think>|$)", re.DOTALL)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Setzt den Streaming-Zustand für feed() zurück."""
+        self._stream_window = ""
+        self.stream_violations: List[str] = []
+
     def check(self, response: str) -> Tuple[bool, List[str]]:
         """
         Prüft Response auf Identity Leaks.
@@ -161,15 +178,101 @@ class IdentityGuardrail:
         Returns:
             (is_valid, violations): Tuple mit Validitätsstatus und Liste der Violations
         """
-        violations = []
-
-        for pattern, description in self.LEAK_PATTERNS:
-            if re.search(pattern, response):
-                violations.append(f"Identity Leak: {description}")
+        violations = [f"Identity Leak: {description}" for description in self._scan(response)]
 
         is_valid = len(violations) == 0
         return is_valid, violations
 
+    def is_clean(self, response: str) -> bool:
+        """
+        Schneller Vorfilter: ein einziger Scan mit der Alternation aller Patterns.
+
+        True heißt garantiert leak-frei - ``check`` und ``auto_correct`` können
+        dann übersprungen werden.
+        """
+        return self._ANY_LEAK.search(response) is None
+
+    def _scan(self, text: str) -> List[str]:
+        """
+        Ein Durchlauf über ``text``: Beschreibungen aller gefundenen Leak-Patterns
+        in der Reihenfolge von LEAK_PATTERNS.
+
+        Jeder Treffer eines Einzel-Patterns beginnt an einer Position, an der
+        auch die Alternation matcht - es reicht also, deren Startpositionen
+        abzulaufen und dort die noch offenen Patterns mit ``match`` zu prüfen.
+        """
+        match = self._ANY_LEAK.search(text)
+        if match is None:
+            return []
+
+        pending = dict(enumerate(self._LEAK_REGEXES))
+        found = []
+        while match is not None and pending:
+            start = match.start()
+            for index, (regex, _) in list(pending.items()):
+                if regex.match(text, start):
+                    found.append(index)
+                    del pending[index]
+            match = self._ANY_LEAK.search(text, start + 1)
+
+        return [self._LEAK_REGEXES[index][1] for index in sorted(found)]
+
+    def check_many(self, responses: List[str]) -> List[Tuple[bool, List[str]]]:
+        """
+        Prüft mehrere Responses (z.B. Ergebnisse eines parallelen Testlaufs).
+
+        Returns:
+            Liste von (is_valid, violations) in der Reihenfolge der Eingabe
+        """
+        return [self.check(response) for response in responses]
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Inkrementelle Prüfung für Streaming-Responses.
+
+        Geprüft wird ein rollierendes Fenster aus vorheriger und aktueller
+        Zeile - die Leak-Patterns reichen nicht über mehrere Zeilen, Treffer
+        über Chunk-Grenzen hinweg werden also erkannt. Alle bisher gefundenen
+        Violations stehen in ``stream_violations``.
+
+        Args:
+            chunk: Neuer Text-Chunk aus dem Stream
+
+        Returns:
+            Durch diesen Chunk neu hinzugekommene Violations (leer = ok)
+        """
+        window = self._stream_window + chunk
+        visible = self._THINK_BLOCK.sub("", window)
+
+        new_violations = []
+        for description in self._scan(visible):
+            violation = f"Identity Leak: {description}"
+            if violation not in self.stream_violations:
+                self.stream_violations.append(violation)
+                new_violations.append(violation)
+
+        self._stream_window = self._next_window(window)
+        return new_violations
+
+    @staticmethod
+    def _next_window(window: str) -> str:
+        """Fenster für den nächsten feed(): vorherige Zeile, offener Think-Block gekürzt."""
+        last_newline = window.rfind("\n")
+        start = window.rfind("\n", 0, last_newline) + 1 if last_newline > 0 else 0
+
+        think_open = window.rfind("<think>")
+        think_close = window.rfind("</think>")
+        if think_open > think_close:
+            # Inhalt des offenen Blocks wird nie geprüft - nur dessen Ende behalten,
+            # damit ein über Chunks geteiltes </think> erkannt wird (konstante Größe
+            # statt den ganzen Reasoning-Block bei jedem Chunk erneut zu scannen)
+            body_start = think_open + len("<think>")
+            tail_start = max(body_start, len(window) - (len("</think>") - 1))
+            return window[min(start, think_open):body_start] + window[tail_start:]
+        if think_close != -1:
+            start = max(start, think_close + len("</think>"))
+        return window[start:]
+
     def auto_correct(self, response: str) -> str:
         """
         Versucht automatische Korrektur bekannter Leaks.
@@ -182,8 +285,8 @@ class IdentityGuardrail:
         """
         corrected = response
 
-        for pattern, replacement in self.CORRECTIONS:
-            corrected = re.sub(pattern, replacement, corrected)
+        for regex, replacement in self._CORRECTION_REGEXES:
+            corrected = regex.sub(replacement, corrected)
 
         return corrected
 
@@ -202,6 +305,8 @@ class ReflectionValidator:
     - Struktur-Vollständigkeit
     """
 
+    _IDENTITY_FIELD = re.compile(r"identity:\s*(.+?)(?:\n|$)")
+
     def validate(self, response: str) -> Tuple[bool, Optional[str]]:
         """
         Prüft ob Reflexion korrekt ist.
@@ -241,7 +346,7 @@ class ReflectionValidator:
         # CRITICAL: Check identity field
         if "identity: SelfAI" not in reflection and "identity:SelfAI" not in reflection:
             # Try to extract what identity was claimed
-            identity_match = re.search(r"identity:\s*(.+?)(?:\n|$)", reflection)
+            identity_match = self._IDENTITY_FIELD.search(reflection)
             claimed_identity = identity_match.group(1).strip() if identity_match else "NONE"
             return False, f"IDENTITY LEAK in Reflexion! Behauptet: '{claimed_identity}', erwartet: 'SelfAI'"
 
@@ -391,6 +496,7 @@ class IdentityMetrics:
     identity_leaks: int = 0
     auto_corrections: int = 0
     retries: int = 0
+    fast_path_skips: int = 0
     judge_scores: List[float] = None
 
     def __post_init__(self):
@@ -402,10 +508,13 @@ class IdentityMetrics:
         had_leak: bool,
         was_corrected: bool,
         retry_count: int,
-        judge_score: Optional[float] = None
+        judge_score: Optional[float] = None,
+        fast_path: bool = False
     ):
         """Loggt eine Response."""
         self.total_responses += 1
+        if fast_path:
+            self.fast_path_skips += 1
         if had_leak:
             self.identity_leaks += 1
         if was_corrected:
@@ -428,6 +537,7 @@ class IdentityMetrics:
 ║  Identity Leaks:     {self.identity_leaks:>5} ({leak_rate:>5.1f}%)          ║
 ║  Auto-Corrections:   {self.auto_corrections:>5} ({correction_rate:>5.1f}% erfolg) ║
 ║  Total Retries:      {self.retries:>5}                    ║
+║  Fast-Path Skips:    {self.fast_path_skips:>5}                    ║
 ║  Avg Judge Score:    {avg_judge:>5.1f}/10                ║
 ╚═══════════════════════════════════════════════╝
 """.strip()
@@ -0,0 +1,210 @@
+"""
+Exact-Match Cache für LLM-Antworten.
+
+Gleiche Anfrage (Modell, Prompts, max_tokens, temperature, History) liefert die
+zuvor gespeicherte Roh-Antwort statt eines erneuten API-Calls. Gecacht wird nur
+deterministisches Sampling (temperature == 0) - bei höheren Temperaturen wäre
+eine gespeicherte Antwort nicht mehr repräsentativ.
+
+Aufbau: LFU im Speicher (``max_entries``) vor einem optionalen DiskBackend, das
+Einträge als JSON-Datei pro Key ablegt und Neustarts überlebt. Das Verzeichnis
+ist auf ``max_files`` Dateien begrenzt; darüber werden die am längsten nicht
+genutzten Dateien (mtime) gelöscht.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int,
+    temperature: float,
+    history=None,
+) -> str:
+    """sha256 über alle Parameter, die die Antwort beeinflussen."""
+    payload = {
+        "model": model,
+        "system_prompt": system_prompt,
+        "user_prompt": user_prompt,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "history": history or [],
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class DiskBackend:
+    """Legt Einträge als ``<key>.json`` in einem Verzeichnis ab (max. ``max_files``)."""
+
+    # Beim Aufräumen bis auf diesen Anteil von max_files löschen, damit nicht
+    # jeder weitere Schreibvorgang erneut das Verzeichnis durchsucht
+    PRUNE_TARGET = 0.9
+
+    def __init__(self, cache_dir: str | Path, max_files: int = 10_000):
+        self.cache_dir = Path(cache_dir)
+        self.max_files = max_files
+        self._count: Optional[int] = None  # lazy beim ersten set() ermittelt
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                value = json.load(f).get("response")
+            # mtime = letzte Nutzung, damit das Aufräumen genutzte Einträge behält
+            os.utime(path)
+            return value
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            is_new = not path.exists()
+            # Eigene Temp-Datei pro Schreibvorgang - parallele set() für
+            # denselben Key dürfen sich nicht gegenseitig die Datei kürzen
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"response": value}, f, ensure_ascii=False)
+                # Atomar ersetzen, damit parallele Leser nie halbe Dateien sehen
+                os.replace(tmp_name, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+        except OSError as exc:
+            logger.warning(f"⚠️ LLM-Cache konnte nicht geschrieben werden: {exc}")
+            return
+
+        if is_new:
+            self._account_new_file()
+
+    def _account_new_file(self) -> None:
+        with self._lock:
+            if self._count is None:
+                self._count = sum(1 for _ in self.cache_dir.glob("*.json"))
+            else:
+                self._count += 1
+            if self._count > self.max_files:
+                self._prune()
+
+    def _prune(self) -> None:
+        """Löscht die ältesten Dateien bis auf PRUNE_TARGET * max_files."""
+        files = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                files.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+        files.sort()
+        excess = len(files) - int(self.max_files * self.PRUNE_TARGET)
+        removed = 0
+        for _, path in files[:max(excess, 0)]:
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        self._count = len(files) - removed
+
+
+class LLMCache:
+    """LFU-Speichercache mit optionalem Disk-Backend und Hit/Miss-Zählern."""
+
+    def __init__(self, backend: Optional[DiskBackend] = None, max_entries: int = 10_000):
+        self.backend = backend
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, str] = {}
+        self._freq: dict[str, int] = {}
+        # Frequenz -> Keys in Einfügereihenfolge; zusammen mit _min_freq ist die
+        # Verdrängung O(1) statt eines min() über alle Einträge
+        self._buckets: dict[int, dict[str, None]] = {}
+        self._min_freq = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_cacheable(temperature: float) -> bool:
+        """Nur deterministische Anfragen werden gecacht."""
+        return temperature == 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._touch(key)
+                self.hits += 1
+                return value
+
+        value = self.backend.get(key) if self.backend else None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, value)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._store(key, value)
+        if self.backend:
+            self.backend.set(key, value)
+
+    def _touch(self, key: str) -> None:
+        """Erhöht die Frequenz von ``key`` und verschiebt ihn in den nächsten Bucket."""
+        freq = self._freq[key]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        self._freq[key] = freq + 1
+        self._buckets.setdefault(freq + 1, {})[key] = None
+
+    def _store(self, key: str, value: str) -> None:
+        if key in self._entries:
+            self._entries[key] = value
+            self._touch(key)
+            return
+        if len(self._entries) >= self.max_entries:
+            # Least Frequently Used verdrängen (bei Gleichstand der älteste)
+            bucket = self._buckets[self._min_freq]
+            victim = next(iter(bucket))
+            del bucket[victim]
+            if not bucket:
+                del self._buckets[self._min_freq]
+            del self._entries[victim]
+            del self._freq[victim]
+        self._entries[key] = value
+        self._freq[key] = 1
+        self._buckets.setdefault(1, {})[key] = None
+        self._min_freq = 1
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total else 0
+        return f"LLM Cache: {self.hits} Hits / {self.misses} Misses ({hit_rate:.1f}% Hit-Rate)"
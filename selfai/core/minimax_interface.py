@@ -1,7 +1,15 @@
 """MiniMax Cloud API Interface with Identity Enforcement"""
+from __future__ import annotations
+
+import asyncio
+import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import random
+from pathlib import Path
+from selfai.core.llm_cache import DiskBackend, LLMCache, make_cache_key
 from selfai.core.think_parser import parse_think_tags
 from selfai.core.identity_enforcer import (
     IDENTITY_CORE,
@@ -21,14 +29,76 @@ ENABLE_GUARDRAILS = True             # Output validation
 ENABLE_REFLECTION = False            # XML reflection requirement (OPTIONAL - MiniMax ignoriert oft)
 ENABLE_JUDGE = False                 # Gemini Judge (costly, opt-in - NUR für /plan!)
 JUDGE_SAMPLE_RATE = 0.1              # 10% sampling
+IDENTITY_MAX_RETRIES = 2             # Neu-Generierungen bei Leak/ungültiger Reflexion
+ENABLE_LLM_CACHE = True              # Exact-Match Cache (nur temperature == 0)
+# Am Projekt-Root verankert, nicht am Arbeitsverzeichnis des Aufrufers
+LLM_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "minimax"
+LLM_CACHE_MAX_FILES = 10_000         # Obergrenze für Dateien im Disk-Cache
+
+# Transiente HTTP-Fehler (Timeout, Rate-Limit, 5xx) mit exponentiellem Backoff + Jitter wiederholen
+RETRY_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_MAX_WAIT = 8.0
+
+
+class _CappedRetry(Retry):
+    """urllib3 < 2.0: Backoff-Obergrenze nur als Klassenattribut einstellbar."""
+    DEFAULT_BACKOFF_MAX = BACKOFF_MAX = RETRY_MAX_WAIT
+
+
+def _build_retry() -> Retry:
+    """Retry-Policy für die Session (auch POST, Retry-After wird respektiert)."""
+    options = dict(
+        total=RETRY_TOTAL,
+        # Read-Timeout/Verbindungsabbruch nach dem Senden nicht wiederholen: der
+        # POST ist nicht idempotent (Completion würde erneut erzeugt und bezahlt).
+        # Wiederholt werden nur Verbindungsfehler und RETRY_STATUS_CODES.
+        read=0,
+        status_forcelist=RETRY_STATUS_CODES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        allowed_methods=["POST"],
+        respect_retry_after_header=True,
+        # Nach dem letzten Versuch die Response zurückgeben -> raise_for_status
+        # liefert den echten Status (z.B. 429) statt eines RetryError
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=RETRY_BACKOFF_FACTOR, backoff_max=RETRY_MAX_WAIT, **options)
+    except TypeError:  # urllib3 < 2.0 kennt backoff_jitter/backoff_max nicht
+        return _CappedRetry(**options)
+
+
+def create_http_session() -> requests.Session:
+    """Keep-Alive Session mit Connection-Pool und Retry-Policy für die MiniMax API."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_build_retry())
+    session.mount("https://", adapter)
+    return session
+
+# Statischer System-Prompt-Prefix, einmal gebaut: byte-identisch über alle Calls
+# und Prozesse, damit der Provider den gemeinsamen Prompt-Prefix cachen kann.
+# Dynamisches (Identity-Reminder, History) steht immer dahinter.
+_IDENTITY_SYSTEM_PREFIX = IDENTITY_CORE + "\n\n" + (
+    REFLECTION_REQUIREMENT + "\n\n" if ENABLE_REFLECTION else ""
+)
 
 class MinimaxInterface:
     def __init__(self, api_key: str, api_base: str = "https://api.minimax.io/v1",
-                 model: str = "MiniMax-M2", ui=None):
+                 model: str = "MiniMax-M2", ui=None, llm_cache: LLMCache | None = None):
         self.api_key = api_key
         self.api_base = api_base.rstrip('/')
         self.model = model
         self.ui = ui  # Optional UI for displaying think tags
+        self._async_client = None  # httpx.AsyncClient für agenerate_response
+
+        # Geteilte Session: Keep-Alive spart TCP+TLS Handshake ab dem zweiten Call
+        self._session = create_http_session()
+
+        # Response-Cache für deterministische Anfragen
+        if llm_cache is None and ENABLE_LLM_CACHE:
+            llm_cache = LLMCache(backend=DiskBackend(LLM_CACHE_DIR, max_files=LLM_CACHE_MAX_FILES))
+        self.llm_cache = llm_cache
 
         # Identity Enforcement Components
         self.identity_injector = IdentityInjector()
@@ -51,20 +121,12 @@ class MinimaxInterface:
         if ui and ENABLE_IDENTITY_ENFORCEMENT:
             ui.status("✅ Identity Enforcement aktiviert", "success")
 
-    def generate_response(self, system_prompt: str, user_prompt: str,
-                         max_tokens: int = 512, temperature: float = 0.7,
-                         history=None, **kwargs) -> str:
-        """Generiert Antwort via MiniMax API mit Identity Enforcement"""
-
+    def _enhance_prompts(self, system_prompt: str, user_prompt: str) -> tuple[str, str]:
+        """Wendet Phase 0 (System Prompt Hardening) und Phase 1 (Injection) an."""
         # === PHASE 0: System Prompt Hardening ===
         if ENABLE_IDENTITY_ENFORCEMENT:
-            # Prepend IDENTITY_CORE to system prompt
-            enhanced_system_prompt = IDENTITY_CORE + "\n\n"
-
-            if ENABLE_REFLECTION:
-                enhanced_system_prompt += REFLECTION_REQUIREMENT + "\n\n"
-
-            enhanced_system_prompt += system_prompt
+            # Prepend IDENTITY_CORE (+ optional REFLECTION_REQUIREMENT) to system prompt
+            enhanced_system_prompt = _IDENTITY_SYSTEM_PREFIX + system_prompt
         else:
             enhanced_system_prompt = system_prompt
 
@@ -74,137 +136,305 @@ class MinimaxInterface:
         else:
             enhanced_user_prompt = user_prompt
 
-        # Retry loop for identity enforcement
-        max_retries = 2
-        for attempt in range(max_retries + 1):
-            # === API Call ===
-            url = f"{self.api_base}/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            model_name = self.model.replace("openai/", "")
-
-            # Messages mit History
-            messages = [{"role": "system", "content": enhanced_system_prompt}]
-            if history:
-                messages.extend(history)
-            messages.append({"role": "user", "content": enhanced_user_prompt})
-
-            data = {
-                "model": model_name,
-                "messages": messages,
-                "max_tokens": max_tokens,
-                "temperature": temperature
-            }
+        return enhanced_system_prompt, enhanced_user_prompt
+
+    def _build_request(self, system_prompt: str, user_prompt: str, max_tokens: int,
+                       temperature: float, history=None) -> tuple[str, dict, dict]:
+        """Baut URL, Header und Payload für /chat/completions."""
+        url = f"{self.api_base}/chat/completions"
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        model_name = self.model.replace("openai/", "")
+
+        # Messages mit History
+        messages = [{"role": "system", "content": system_prompt}]
+        if history:
+            messages.extend(history)
+        messages.append({"role": "user", "content": user_prompt})
+
+        data = {
+            "model": model_name,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        return url, headers, data
+
+    def _cache_key(self, system_prompt: str, user_prompt: str, max_tokens: int,
+                   temperature: float, history=None) -> str | None:
+        """Cache-Key über die Original-Prompts (Injection rotiert pro Turn) oder None."""
+        if self.llm_cache is None or not self.llm_cache.is_cacheable(temperature):
+            return None
+        return make_cache_key(self.model, system_prompt, user_prompt, max_tokens, temperature, history)
+
+    def _process_response(self, raw_content: str, user_prompt: str,
+                          attempt: int, max_retries: int) -> tuple[str, bool]:
+        """
+        Phase 2-4 für eine Roh-Antwort.
+
+        Returns:
+            (clean_content, retry) - bei retry=True soll neu generiert werden
+        """
+        # Parse and display think tags separately
+        clean_content, think_contents = parse_think_tags(raw_content)
+
+        # Display think tags in UI if available
+        if self.ui and think_contents:
+            self.ui.show_think_tags(think_contents)
+
+        # === PHASE 2: Reflection Validation ===
+        if ENABLE_IDENTITY_ENFORCEMENT and ENABLE_REFLECTION:
+            is_valid_reflection, error_msg = self.reflection_validator.validate(raw_content)
+
+            if not is_valid_reflection:
+                if self.ui:
+                    self.ui.status(
+                        f"⚠️ Reflexion ungültig (Attempt {attempt+1}/{max_retries+1}): {error_msg}",
+                        "warning"
+                    )
+
+                if attempt < max_retries:
+                    logger.warning(f"Reflexion ungültig, retry... ({error_msg})")
+                    return clean_content, True
+                else:
+                    logger.error(f"Reflexion nach {max_retries} Retries ungültig")
+                    # Accept response anyway, just log
+
+        # === PHASE 3: Guardrail Check ===
+        had_leak = False
+        was_corrected = False
+        fast_path = False
+
+        if ENABLE_IDENTITY_ENFORCEMENT and ENABLE_GUARDRAILS:
+            # Vorfilter: saubere Responses (Normalfall) überspringen Check + Auto-Correction
+            fast_path = self.identity_guardrail.is_clean(clean_content)
+
+        if ENABLE_IDENTITY_ENFORCEMENT and ENABLE_GUARDRAILS and not fast_path:
+            is_valid, violations = self.identity_guardrail.check(clean_content)
+
+            if not is_valid:
+                had_leak = True
+
+                if self.ui:
+                    self.ui.status(
+                        f"⚠️ Identity Leak detected (Attempt {attempt+1}/{max_retries+1}): {', '.join(violations)}",
+                        "warning"
+                    )
+
+                # Try auto-correction
+                corrected_content = self.identity_guardrail.auto_correct(clean_content)
+
+                # Re-validate corrected content
+                is_valid_after, _ = self.identity_guardrail.check(corrected_content)
+
+                if is_valid_after:
+                    if self.ui:
+                        self.ui.status("✅ Auto-Correction erfolgreich", "success")
+                    clean_content = corrected_content
+                    was_corrected = True
+                elif attempt < max_retries:
+                    # Auto-correction failed, retry generation
+                    logger.warning(f"Auto-correction fehlgeschlagen, retry generation...")
+                    return clean_content, True
+                else:
+                    # Max retries reached, use corrected version anyway
+                    logger.warning(f"Max retries erreicht, nutze korrigierte Version")
+                    clean_content = corrected_content
+                    was_corrected = True
+
+        # === PHASE 4: Judge Evaluation (Sampling) ===
+        judge_score = None
+        if (ENABLE_IDENTITY_ENFORCEMENT and ENABLE_JUDGE and
+            self.identity_judge and random.random() < JUDGE_SAMPLE_RATE):
 
             try:
-                response = requests.post(url, headers=headers, json=data, timeout=60)
-                response.raise_for_status()
-                result = response.json()
-                raw_content = result["choices"][0]["message"]["content"]
-
-                # Parse and display think tags separately
-                clean_content, think_contents = parse_think_tags(raw_content)
-
-                # Display think tags in UI if available
-                if self.ui and think_contents:
-                    self.ui.show_think_tags(think_contents)
-
-                # === PHASE 2: Reflection Validation ===
-                if ENABLE_IDENTITY_ENFORCEMENT and ENABLE_REFLECTION:
-                    is_valid_reflection, error_msg = self.reflection_validator.validate(raw_content)
-
-                    if not is_valid_reflection:
-                        if self.ui:
-                            self.ui.status(
-                                f"⚠️ Reflexion ungültig (Attempt {attempt+1}/{max_retries+1}): {error_msg}",
-                                "warning"
-                            )
-
-                        if attempt < max_retries:
-                            logger.warning(f"Reflexion ungültig, retry... ({error_msg})")
-                            continue
-                        else:
-                            logger.error(f"Reflexion nach {max_retries} Retries ungültig")
-                            # Accept response anyway, just log
-
-                # === PHASE 3: Guardrail Check ===
-                had_leak = False
-                was_corrected = False
-
-                if ENABLE_IDENTITY_ENFORCEMENT and ENABLE_GUARDRAILS:
-                    is_valid, violations = self.identity_guardrail.check(clean_content)
-
-                    if not is_valid:
-                        had_leak = True
-
-                        if self.ui:
-                            self.ui.status(
-                                f"⚠️ Identity Leak detected (Attempt {attempt+1}/{max_retries+1}): {', '.join(violations)}",
-                                "warning"
-                            )
-
-                        # Try auto-correction
-                        corrected_content = self.identity_guardrail.auto_correct(clean_content)
-
-                        # Re-validate corrected content
-                        is_valid_after, _ = self.identity_guardrail.check(corrected_content)
-
-                        if is_valid_after:
-                            if self.ui:
-                                self.ui.status("✅ Auto-Correction erfolgreich", "success")
-                            clean_content = corrected_content
-                            was_corrected = True
-                        elif attempt < max_retries:
-                            # Auto-correction failed, retry generation
-                            logger.warning(f"Auto-correction fehlgeschlagen, retry generation...")
-                            continue
-                        else:
-                            # Max retries reached, use corrected version anyway
-                            logger.warning(f"Max retries erreicht, nutze korrigierte Version")
-                            clean_content = corrected_content
-                            was_corrected = True
-
-                # === PHASE 4: Judge Evaluation (Sampling) ===
-                judge_score = None
-                if (ENABLE_IDENTITY_ENFORCEMENT and ENABLE_JUDGE and
-                    self.identity_judge and random.random() < JUDGE_SAMPLE_RATE):
-
-                    try:
-                        judge_result = self.identity_judge.evaluate(user_prompt, raw_content)
-                        judge_score = judge_result.total_score
-
-                        # Check if retry recommended
-                        if judge_result.recommendation == "retry" and attempt < max_retries:
-                            if self.ui:
-                                self.ui.status(
-                                    f"⚠️ Judge empfiehlt Retry (Score: {judge_score:.1f}/10)",
-                                    "warning"
-                                )
-                            continue
-
-                    except Exception as e:
-                        logger.warning(f"Judge evaluation fehlgeschlagen: {e}")
-
-                # === Log Metrics ===
-                self.identity_metrics.log_response(
-                    had_leak=had_leak,
-                    was_corrected=was_corrected,
-                    retry_count=attempt,
-                    judge_score=judge_score
-                )
+                judge_result = self.identity_judge.evaluate(user_prompt, raw_content)
+                judge_score = judge_result.total_score
+
+                # Check if retry recommended
+                if judge_result.recommendation == "retry" and attempt < max_retries:
+                    if self.ui:
+                        self.ui.status(
+                            f"⚠️ Judge empfiehlt Retry (Score: {judge_score:.1f}/10)",
+                            "warning"
+                        )
+                    return clean_content, True
+
+            except Exception as e:
+                logger.warning(f"Judge evaluation fehlgeschlagen: {e}")
 
+        # === Log Metrics ===
+        self.identity_metrics.log_response(
+            had_leak=had_leak,
+            was_corrected=was_corrected,
+            retry_count=attempt,
+            judge_score=judge_score,
+            fast_path=fast_path
+        )
+
+        return clean_content, False
+
+    def _enforcement_steps(self, user_prompt: str, cache_key: str | None,
+                           max_retries: int = IDENTITY_MAX_RETRIES):
+        """
+        Retry-Loop von Identity Enforcement, unabhängig vom Transport.
+
+        Generator: liefert die Attempt-Nummer, sobald eine neue Roh-Antwort
+        gebraucht wird, und erwartet diese per ``send()`` (None = Stream wegen
+        Leak abgebrochen, neu generieren). Die fertige Antwort
+        kommt als ``StopIteration.value``. Sync und async teilen sich so
+        denselben Loop (siehe _run_enforcement / _arun_enforcement).
+        """
+        clean_content = ""
+        for attempt in range(max_retries + 1):
+            # Retries gehen immer an die API - der Cache würde dieselbe Antwort liefern
+            raw_content = self.llm_cache.get(cache_key) if cache_key and attempt == 0 else None
+            from_cache = raw_content is not None
+            if not from_cache:
+                raw_content = yield attempt
+                if raw_content is None:
+                    continue
+
+            clean_content, retry = self._process_response(raw_content, user_prompt, attempt, max_retries)
+            if not retry:
+                if cache_key and not from_cache:
+                    self.llm_cache.set(cache_key, raw_content)
                 # Success! Return clean content
                 return clean_content
 
+        # Should not reach here, but just in case
+        logger.error("Identity enforcement failed nach allen Retries")
+        return clean_content  # Return last attempt
+
+    def _run_enforcement(self, fetch, user_prompt: str, cache_key: str | None) -> str:
+        """Treibt _enforcement_steps mit ``fetch(attempt) -> raw_content``."""
+        steps = self._enforcement_steps(user_prompt, cache_key)
+        try:
+            attempt = next(steps)
+            while True:
+                attempt = steps.send(fetch(attempt))
+        except StopIteration as done:
+            return done.value
+
+    async def _arun_enforcement(self, fetch, user_prompt: str, cache_key: str | None) -> str:
+        """Wie _run_enforcement, ``fetch(attempt)`` ist hier eine Coroutine-Funktion."""
+        steps = self._enforcement_steps(user_prompt, cache_key)
+        try:
+            attempt = next(steps)
+            while True:
+                attempt = steps.send(await fetch(attempt))
+        except StopIteration as done:
+            return done.value
+
+    def generate_response(self, system_prompt: str, user_prompt: str,
+                         max_tokens: int = 512, temperature: float = 0.7,
+                         history=None, **kwargs) -> str:
+        """Generiert Antwort via MiniMax API mit Identity Enforcement"""
+        enhanced_system_prompt, enhanced_user_prompt = self._enhance_prompts(system_prompt, user_prompt)
+        url, headers, data = self._build_request(
+            enhanced_system_prompt, enhanced_user_prompt, max_tokens, temperature, history
+        )
+        cache_key = self._cache_key(system_prompt, user_prompt, max_tokens, temperature, history)
+
+        def fetch(attempt: int) -> str:
+            try:
+                response = self._session.post(url, headers=headers, json=data, timeout=60)
+                response.raise_for_status()
+                return response.json()["choices"][0]["message"]["content"]
             except Exception as e:
                 logger.error(f"❌ MiniMax Fehler: {e}")
                 raise
 
-        # Should not reach here, but just in case
-        logger.error("Identity enforcement failed nach allen Retries")
-        return clean_content  # Return last attempt
+        return self._run_enforcement(fetch, user_prompt, cache_key)
+
+    async def agenerate_response(self, system_prompt: str, user_prompt: str,
+                                 max_tokens: int = 512, temperature: float = 0.7,
+                                 history=None, **kwargs) -> str:
+        """
+        Async-Variante von generate_response.
+
+        Mehrere Aufrufe lassen sich per asyncio.gather parallel ausführen - die
+        Laufzeit ist dann ~max(RTT) statt N * RTT. Identity Enforcement läuft
+        identisch zur synchronen Variante.
+        """
+        enhanced_system_prompt, enhanced_user_prompt = self._enhance_prompts(system_prompt, user_prompt)
+        url, headers, data = self._build_request(
+            enhanced_system_prompt, enhanced_user_prompt, max_tokens, temperature, history
+        )
+        cache_key = self._cache_key(system_prompt, user_prompt, max_tokens, temperature, history)
+
+        async def fetch(attempt: int) -> str:
+            try:
+                response = await self._apost_with_retry(url, headers, data)
+                return response.json()["choices"][0]["message"]["content"]
+            except Exception as e:
+                logger.error(f"❌ MiniMax Fehler: {e}")
+                raise
+
+        return await self._arun_enforcement(fetch, user_prompt, cache_key)
+
+    def generate_response_streamed(self, system_prompt: str, user_prompt: str,
+                                   max_tokens: int = 512, temperature: float = 0.7,
+                                   history=None, guardrail: IdentityGuardrail | None = None) -> str:
+        """
+        Wie generate_response, die Roh-Antwort kommt aber per Streaming.
+
+        ``guardrail.feed()`` prüft parallel zur Generierung; bei einem Leak wird
+        der Stream abgebrochen und sofort neu generiert (fail-fast). Der letzte
+        Versuch läuft ohne Abbruch, damit die Auto-Correction eine vollständige
+        Antwort bekommt. Danach dieselbe Pipeline (Phase 2-4, Metrics) wie
+        generate_response.
+        """
+        guardrail = guardrail or IdentityGuardrail()
+        cache_key = self._cache_key(system_prompt, user_prompt, max_tokens, temperature, history)
+
+        def fetch(attempt: int) -> str | None:
+            guardrail.reset()
+            active = guardrail if attempt < IDENTITY_MAX_RETRIES else None
+            raw_content = "".join(self.stream_response(
+                system_prompt, user_prompt, max_tokens, temperature, history, guardrail=active
+            ))
+            if active is not None and active.stream_violations:
+                return None
+            return raw_content
+
+        return self._run_enforcement(fetch, user_prompt, cache_key)
+
+    async def _apost_with_retry(self, url: str, headers: dict, data: dict):
+        """
+        POST über den AsyncClient; transiente Status-Codes werden wie in der
+        Session-Retry-Policy wiederholt (Wartezeit: random exponential, max RETRY_MAX_WAIT).
+        """
+        client = self._get_async_client()
+        for attempt in range(RETRY_TOTAL + 1):
+            response = await client.post(url, headers=headers, json=data)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == RETRY_TOTAL:
+                response.raise_for_status()
+                return response
+
+            wait = random.uniform(0, min(RETRY_MAX_WAIT, RETRY_BACKOFF_FACTOR * 2 ** attempt))
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                wait = max(wait, float(retry_after))
+            logger.warning(
+                f"MiniMax HTTP {response.status_code}, retry {attempt + 1}/{RETRY_TOTAL} in {wait:.1f}s"
+            )
+            await asyncio.sleep(wait)
+
+    def _get_async_client(self):
+        """Geteilter httpx.AsyncClient (lazy, damit httpx nur für async nötig ist)."""
+        if self._async_client is None:
+            import httpx
+            self._async_client = httpx.AsyncClient(timeout=60)
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Schließt den geteilten AsyncClient."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
 
     def _call_api_direct(self, system_prompt: str, user_prompt: str,
                         max_tokens: int = 512, temperature: float = 0.7) -> str:
@@ -232,7 +462,7 @@ class MinimaxInterface:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            response = self._session.post(url, headers=headers, json=data, timeout=60)
             response.raise_for_status()
             result = response.json()
             content = result["choices"][0]["message"]["content"]
@@ -245,75 +475,62 @@ class MinimaxInterface:
             logger.error(f"❌ Direct MiniMax API Error: {e}")
             raise
 
-    def stream_generate_response(self, system_prompt: str, user_prompt: str,
-                                 max_tokens: int = 512, temperature: float = 0.7,
-                                 history=None, **kwargs):
-        """Echtes Streaming via MiniMax API."""
-        
-        # === PHASE 0: System Prompt Hardening ===
-        if ENABLE_IDENTITY_ENFORCEMENT:
-            enhanced_system_prompt = IDENTITY_CORE + "\n\n"
-            if ENABLE_REFLECTION:
-                enhanced_system_prompt += REFLECTION_REQUIREMENT + "\n\n"
-            enhanced_system_prompt += system_prompt
-        else:
-            enhanced_system_prompt = system_prompt
+    def stream_response(self, system_prompt: str, user_prompt: str,
+                        max_tokens: int = 512, temperature: float = 0.7,
+                        history=None, guardrail: IdentityGuardrail | None = None):
+        """
+        Streamt Content-Deltas via SSE (ohne Fallback).
 
-        # === PHASE 1: Identity Injection ===
-        if ENABLE_IDENTITY_ENFORCEMENT and ENABLE_INJECTION:
-            enhanced_user_prompt = self.identity_injector.inject(user_prompt)
-        else:
-            enhanced_user_prompt = user_prompt
+        Mit ``guardrail`` wird jeder Chunk per ``feed()`` geprüft, bevor er
+        ausgegeben wird. Beim ersten Leak wird der Stream geschlossen und die
+        Generierung abgebrochen - die Violations stehen danach in
+        ``guardrail.stream_violations``.
+        """
+        enhanced_system_prompt, enhanced_user_prompt = self._enhance_prompts(system_prompt, user_prompt)
+        url, headers, data = self._build_request(
+            enhanced_system_prompt, enhanced_user_prompt, max_tokens, temperature, history
+        )
+        data["stream"] = True  # Enable API Streaming
 
-        url = f"{self.api_base}/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        model_name = self.model.replace("openai/", "")
+        with self._session.post(url, headers=headers, json=data, stream=True, timeout=60) as response:
+            response.raise_for_status()
 
-        messages = [{"role": "system", "content": enhanced_system_prompt}]
-        if history:
-            messages.extend(history)
-        messages.append({"role": "user", "content": enhanced_user_prompt})
+            for line in response.iter_lines():
+                if not line:
+                    continue
 
-        data = {
-            "model": model_name,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "stream": True  # Enable API Streaming
-        }
+                decoded_line = line.decode('utf-8').strip()
+                if not decoded_line.startswith("data: "):
+                    continue
+
+                data_str = decoded_line[6:]  # Remove "data: " prefix
+                if data_str == "[DONE]":
+                    break
+
+                try:
+                    chunk_json = json.loads(data_str)
+                    delta = chunk_json["choices"][0]["delta"]
+                    content = delta.get("content", "")
+                except Exception:
+                    # Skip malformed chunks
+                    continue
+
+                # MiniMax specifics: sometimes content is in other fields or empty
+                if not content:
+                    continue
 
+                if guardrail is not None and guardrail.feed(content):
+                    logger.warning(f"Identity Leak im Stream, breche ab: {guardrail.stream_violations}")
+                    return
+
+                yield content
+
+    def stream_generate_response(self, system_prompt: str, user_prompt: str,
+                                 max_tokens: int = 512, temperature: float = 0.7,
+                                 history=None, **kwargs):
+        """Echtes Streaming via MiniMax API."""
         try:
-            with requests.post(url, headers=headers, json=data, stream=True, timeout=60) as response:
-                response.raise_for_status()
-                
-                for line in response.iter_lines():
-                    if not line:
-                        continue
-                    
-                    decoded_line = line.decode('utf-8').strip()
-                    if decoded_line.startswith("data: "):
-                        data_str = decoded_line[6:] # Remove "data: " prefix
-                        
-                        if data_str == "[DONE]":
-                            break
-                            
-                        try:
-                            import json
-                            chunk_json = json.loads(data_str)
-                            delta = chunk_json["choices"][0]["delta"]
-                            content = delta.get("content", "")
-                            
-                            # MiniMax specifics: sometimes content is in other fields or empty
-                            if content:
-                                yield content
-                                
-                        except Exception:
-                            # Skip malformed chunks
-                            continue
-                            
+            yield from self.stream_response(system_prompt, user_prompt, max_tokens, temperature, history)
         except Exception as e:
             logger.error(f"❌ MiniMax Streaming Fehler: {e}")
             # Fallback to blocking if streaming fails
@@ -326,4 +543,7 @@ class MinimaxInterface:
         Returns:
             Formatierter Metrics-Report
         """
-        return self.identity_metrics.report()
+        report = self.identity_metrics.report()
+        if self.llm_cache is not None:
+            report += "\n" + self.llm_cache.stats()
+        return report
@@ -1,5 +1,6 @@
 import json
 import os
+import re
 import sys
 import subprocess
 from datetime import datetime
@@ -73,6 +74,75 @@ SELFIMPROVE_ALLOWED_PATTERNS = [
 ]
 
 
+# Smart Agent Detection: Tool-Action, Self-Introspection und Multi-Step
+# aktivieren den Agent Loop - eine Alternation statt N Substring-Suchen
+AGENT_TOOL_KEYWORDS = [
+    "liste", "list", "zeige", "show",
+    "suche", "search", "finde", "find",
+    "erstelle", "create", "schreibe", "write",
+    "führe aus", "execute", "run",
+    "lese", "read", "öffne", "open",
+    "analysiere", "analyze",
+    "teste", "test",
+]
+AGENT_INTROSPECTION_KEYWORDS = [
+    "welche tools", "deine tools", "your tools",
+    "dein code", "your code", "selfai code",
+    "wie funktioniert", "how does", "how do you",
+    "was kannst du", "what can you",
+]
+AGENT_MULTI_STEP_INDICATORS = [" und ", " and ", " dann ", " danach "]
+# Einfache Wissensfragen (nicht Agent)
+SIMPLE_QUERY_PATTERNS = [
+    "was ist", "what is",
+    "erkläre", "explain",
+    "wie geht", "how to",
+    "warum", "why",
+    "hallo", "hi", "hey",
+]
+_AGENT_LOOP_RE = re.compile("|".join(map(re.escape, (
+    AGENT_TOOL_KEYWORDS + AGENT_INTROSPECTION_KEYWORDS + AGENT_MULTI_STEP_INDICATORS
+))))
+_SIMPLE_QUERY_RE = re.compile("|".join(map(re.escape, SIMPLE_QUERY_PATTERNS)))
+
+
+# Smart Detection: Nur Agent Loop für komplexe Tasks aktivieren
+def requires_agent_loop(user_input: str) -> bool:
+    """
+    Entscheidet ob der Agent Loop für diese Query nötig ist.
+
+    Agent Loop wird aktiviert für:
+    - Explizite Tool-Requests ("liste", "suche", "erstelle", "führe aus")
+    - Self-Introspection ("welche tools", "dein code", "wie funktioniert")
+    - Multi-Step Tasks ("analysiere und", "finde und", "erstelle und")
+    - Commands (/, beginnend)
+
+    Agent Loop wird NICHT aktiviert für:
+    - Einfache Wissensfragen ("Was ist...", "Erkläre...")
+    - Grüße ("Hallo", "Hi")
+    - Kurze Fragen (< 5 Wörter ohne Action-Verben)
+    """
+    user_lower = user_input.lower().strip()
+
+    # Commands aktivieren immer Agent (außer /switch, /memory)
+    if user_input.startswith("/") and not user_input.startswith(("/switch", "/memory")):
+        return True
+
+    # Check für Action Keywords, Self-Introspection und Multi-Step
+    if _AGENT_LOOP_RE.search(user_lower):
+        return True
+
+    # Wenn nur Wissensfrage ohne Action → kein Agent
+    # (Tool-Keywords sind oben bereits ausgeschlossen)
+    word_count = len(user_input.split())
+    if word_count < 10 and _SIMPLE_QUERY_RE.search(user_lower):
+        return False
+
+    # Default: Bei Unsicherheit KEIN Agent (konservativ)
+    # User kann immer explizit Tools triggern wenn nötig
+    return False
+
+
 def _format_gigabytes(value_bytes: float) -> float:
     return value_bytes / (1024**3)
 
@@ -234,7 +304,7 @@ def _build_planner_context(
 ) -> PlannerContext:
     agents_data = []
     for agent in agent_manager.list_agents():
-        categories = ", ".join(agent.memory_categories) or "-"
+        categories = agent.memory_categories_label
         details = [f"Memory: {categories}", f"Workspace: {agent.workspace_slug}"]
         if agent.description:
             details.insert(0, agent.description.strip())
@@ -1404,6 +1474,7 @@ def main():
                 if first_chunk:
                     ui.stop_spinner()
                 else:
+                    ui.flush_stream()
                     print()
                 return "".join(chunks), True
             except Exception as exc:  # pylint: disable=broad-except
@@ -2148,6 +2219,7 @@ Output ONLY the Python code, no markdown, no explanations."""
                         progress_callback=_planner_stream,
                     )
                     if stream_state["active"]:
+                        ui.flush_stream()
                         print()
                     selected_provider_name = provider_name
                     ui.status(
@@ -2161,6 +2233,7 @@ Output ONLY the Python code, no markdown, no explanations."""
                     break
                 except PlannerError as exc:
                     if stream_state["active"]:
+                        ui.flush_stream()
                         print()
                     hint = ""
                     cause = getattr(exc, "__cause__", None)
@@ -2507,83 +2580,6 @@ Output ONLY the Python code, no markdown, no explanations."""
         # =============================================================================
         ENABLE_AGENT_MODE = getattr(config.system, "enable_agent_mode", True)
 
-        # Smart Detection: Nur Agent Loop für komplexe Tasks aktivieren
-        def requires_agent_loop(user_input: str) -> bool:
-            """
-            Entscheidet ob der Agent Loop für diese Query nötig ist.
-
-            Agent Loop wird aktiviert für:
-            - Explizite Tool-Requests ("liste", "suche", "erstelle", "führe aus")
-            - Self-Introspection ("welche tools", "dein code", "wie funktioniert")
-            - Multi-Step Tasks ("analysiere und", "finde und", "erstelle und")
-            - Commands (/, beginnend)
-
-            Agent Loop wird NICHT aktiviert für:
-            - Einfache Wissensfragen ("Was ist...", "Erkläre...")
-            - Grüße ("Hallo", "Hi")
-            - Kurze Fragen (< 5 Wörter ohne Action-Verben)
-            """
-            user_lower = user_input.lower().strip()
-
-            # Commands aktivieren immer Agent (außer /switch, /memory)
-            if user_input.startswith("/") and not user_input.startswith(("/switch", "/memory")):
-                return True
-
-            # Tool-Action Keywords
-            tool_keywords = [
-                "liste", "list", "zeige", "show",
-                "suche", "search", "finde", "find",
-                "erstelle", "create", "schreibe", "write",
-                "führe aus", "execute", "run",
-                "lese", "read", "öffne", "open",
-                "analysiere", "analyze",
-                "teste", "test"
-            ]
-
-            # Self-Introspection Keywords
-            introspection_keywords = [
-                "welche tools", "deine tools", "your tools",
-                "dein code", "your code", "selfai code",
-                "wie funktioniert", "how does", "how do you",
-                "was kannst du", "what can you"
-            ]
-
-            # Multi-Step Indicators
-            multi_step_indicators = [" und ", " and ", " dann ", " danach "]
-
-            # Check für Action Keywords
-            if any(keyword in user_lower for keyword in tool_keywords):
-                return True
-
-            # Check für Self-Introspection
-            if any(keyword in user_lower for keyword in introspection_keywords):
-                return True
-
-            # Check für Multi-Step
-            if any(indicator in user_lower for indicator in multi_step_indicators):
-                return True
-
-            # Einfache Wissensfragen (nicht Agent)
-            simple_patterns = [
-                "was ist", "what is",
-                "erkläre", "explain",
-                "wie geht", "how to",
-                "warum", "why",
-                "hallo", "hi", "hey"
-            ]
-
-            # Wenn nur Wissensfrage ohne Action → kein Agent
-            word_count = len(user_input.split())
-            if word_count < 10 and any(pattern in user_lower for pattern in simple_patterns):
-                # Aber: Wenn zusätzlich Tool-Keywords → doch Agent
-                has_tool_keyword = any(kw in user_lower for kw in tool_keywords)
-                if not has_tool_keyword:
-                    return False
-
-            # Default: Bei Unsicherheit KEIN Agent (konservativ)
-            # User kann immer explizit Tools triggern wenn nötig
-            return False
-
         use_agent = ENABLE_AGENT_MODE and requires_agent_loop(user_input)
 
         if use_agent and llm_interface:
@@ -414,9 +414,27 @@ def list_calendar_events(
 _TOOL_REGISTRY: Dict[str, RegisteredTool] = {}
 
 
+@lru_cache(maxsize=1)
+def _smol_tools() -> tuple[Any, ...]:
+    smol_tools = []
+    for tool in _TOOL_REGISTRY.values():
+        try:
+            smol_tool = tool.to_smol_tool()
+            smol_tools.append(smol_tool)
+        except Exception as e:
+            # Log but don't fail - skip problematic tools
+            print(
+                f"Warning: Could not convert tool '{tool.name}' to smolagents format: {e}"
+            )
+            continue
+
+    return tuple(smol_tools)
+
+
 def register_tool(tool: RegisteredTool) -> None:
     """Register a tool in the central registry."""
     _TOOL_REGISTRY[tool.name] = tool
+    _smol_tools.cache_clear()
 
 
 register_tool(
@@ -1155,22 +1173,12 @@ def get_tools_for_agent() -> List[Any]:
     """
     Get all registered tools converted to smolagents format.
 
+    The conversion runs once and is cached until the next ``register_tool``.
+
     Returns:
         List of smolagents Tool instances ready for ToolCallingAgent
 
     Raises:
         ImportError: If smolagents is not installed
     """
-    smol_tools = []
-    for tool in _TOOL_REGISTRY.values():
-        try:
-            smol_tool = tool.to_smol_tool()
-            smol_tools.append(smol_tool)
-        except Exception as e:
-            # Log but don't fail - skip problematic tools
-            print(
-                f"Warning: Could not convert tool '{tool.name}' to smolagents format: {e}"
-            )
-            continue
-
-    return smol_tools
+    return list(_smol_tools())
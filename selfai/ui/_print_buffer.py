@@ -0,0 +1,131 @@
+"""
+Gebündelter stdout-Writer für Token-Streaming.
+
+Text wird sofort an den Ziel-Stream übergeben, nur dessen ``flush()`` (der
+eigentliche write-Syscall) wird gebündelt: bei Zeilenumbruch, ab ``max_size``
+ungeflushten Zeichen oder wenn seit dem letzten Flush ``flush_interval``
+Sekunden vergangen sind. Da der Text bereits im Puffer von sys.stdout liegt,
+kann ihn ein späteres ``print()`` anderer Module nicht überholen - die
+Reihenfolge bleibt auch ohne expliziten ``flush()`` des Aufrufers erhalten.
+
+Bleibt ein ungeflushter Rest liegen, schreibt ihn ein einziger, langlebiger
+Flusher-Thread (für alle Puffer gemeinsam) spätestens nach ``flush_interval``.
+"""
+
+import atexit
+import sys
+import threading
+import time
+import weakref
+from typing import Optional, TextIO
+
+# Alle lebenden Puffer; ein einziger atexit-Hook flusht sie (hält sie nicht am Leben)
+_live_buffers: "weakref.WeakSet[PrintBuffer]" = weakref.WeakSet()
+
+# Puffer mit ungeflushtem Rest, abgearbeitet vom gemeinsamen Flusher-Thread
+_pending: "weakref.WeakSet[PrintBuffer]" = weakref.WeakSet()
+_pending_cond = threading.Condition()
+_flusher: Optional[threading.Thread] = None
+
+
+@atexit.register
+def _flush_all() -> None:
+    for buffer in list(_live_buffers):
+        buffer.flush()
+
+
+def _schedule(buffer: "PrintBuffer") -> None:
+    """Meldet einen Puffer beim Flusher-Thread an (startet ihn beim ersten Mal)."""
+    global _flusher
+    with _pending_cond:
+        _pending.add(buffer)
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="PrintBuffer-Flusher", daemon=True)
+            _flusher.start()
+        _pending_cond.notify()
+
+
+def _flush_loop() -> None:
+    while True:
+        with _pending_cond:
+            due = []
+            while not due:
+                now = time.monotonic()
+                timeout = None
+                for buffer in list(_pending):
+                    remaining = buffer._due - now
+                    if remaining <= 0:
+                        _pending.discard(buffer)
+                        due.append(buffer)
+                    elif timeout is None or remaining < timeout:
+                        timeout = remaining
+                if not due:
+                    _pending_cond.wait(timeout)
+        # Außerhalb der Condition flushen: write() hält den Puffer-Lock und meldet
+        # sich dann hier an - umgekehrte Lock-Reihenfolge würde verklemmen
+        for buffer in due:
+            buffer._idle_flush()
+        # Keine starke Referenz über das Warten hinweg halten (GC der TerminalUI)
+        due = buffer = None
+
+
+class PrintBuffer:
+    """Thread-sicherer, zeit- und größenbegrenzter Flush-Bündler."""
+
+    def __init__(self, stream: Optional[TextIO] = None, max_size: int = 4096, flush_interval: float = 0.05) -> None:
+        # stream=None: sys.stdout bei jedem Write neu auflösen (redirect_stdout/Capture greifen)
+        self._stream = stream
+        self._max_size = max_size
+        self._flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._last_flush = 0.0
+        self._unflushed = 0
+        # Stream mit ungeflushtem Text (None: nichts offen) und Deadline für den Flusher
+        self._dirty: Optional[TextIO] = None
+        self._due = 0.0
+        _live_buffers.add(self)
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        with self._lock:
+            stream = self._stream or sys.stdout
+            if self._dirty is not None and self._dirty is not stream:
+                # stdout wurde ersetzt - offenen Rest noch in den alten Stream bringen
+                self._dirty.flush()
+                self._dirty = None
+            stream.write(text)
+            self._unflushed += len(text)
+            now = time.monotonic()
+            if (
+                "\n" in text
+                or self._unflushed >= self._max_size
+                or now - self._last_flush >= self._flush_interval
+            ):
+                self._flush_stream(stream, now)
+            elif self._dirty is None:
+                # Idle-Flush: bleibt der nächste Write aus, erscheint der Rest trotzdem
+                self._dirty = stream
+                self._due = now + self._flush_interval
+                _schedule(self)
+
+    def _idle_flush(self) -> None:
+        with self._lock:
+            if self._dirty is not None:
+                self._flush_stream(self._dirty, time.monotonic())
+
+    def _flush_stream(self, stream: TextIO, now: float) -> None:
+        stream.flush()
+        self._dirty = None
+        self._unflushed = 0
+        self._last_flush = now
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_stream(self._dirty or self._stream or sys.stdout, time.monotonic())
+
+    def __enter__(self) -> "PrintBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
@@ -0,0 +1,89 @@
+"""
+UI-Wrapper, der Ausgaben in einem Hintergrund-Thread schreibt.
+
+``status()`` und ``echo()`` legen die Nachricht nur in eine begrenzte Queue und
+kehren sofort zurück; ein einzelner Daemon-Thread leert die Queue und ruft die
+eigentliche UI auf. Terminal-I/O (ANSI-Formatierung, Schreiben) liegt damit
+nicht mehr im gemessenen Pfad. Die Reihenfolge der Ausgaben bleibt erhalten,
+da es nur einen Consumer gibt.
+
+Ist stdout kein Terminal (CI, Pipe), wird synchron durchgereicht - die
+Ausgabe bleibt dort zeilenweise wie bisher.
+"""
+
+import queue
+import sys
+import threading
+from typing import Any, Optional
+
+# Maximale Anzahl wartender Nachrichten; bei voller Queue blockiert der Aufrufer
+QUEUE_SIZE = 256
+
+_STOP = object()
+
+
+class BackgroundUI:
+    """Leitet status()/echo() über eine Queue an ``inner_ui`` weiter."""
+
+    def __init__(self, inner_ui: Any, enabled: Optional[bool] = None) -> None:
+        self._inner = inner_ui
+        self._enabled = sys.stdout.isatty() if enabled is None else enabled
+        self._q: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        if self._enabled:
+            self._thread = threading.Thread(target=self._consume, name="BackgroundUI", daemon=True)
+            self._thread.start()
+
+    def _consume(self) -> None:
+        while True:
+            item = self._q.get()
+            try:
+                if item is _STOP:
+                    return
+                level, message = item
+                if level is None:
+                    print(message, flush=True)
+                else:
+                    self._inner.status(message, level)
+            except Exception:
+                # Ein Ausgabefehler darf den Consumer nicht beenden
+                pass
+            finally:
+                self._q.task_done()
+
+    def status(self, message: str, level: str = "info") -> None:
+        if self._enabled:
+            self._q.put((level, message))
+        else:
+            self._inner.status(message, level)
+
+    def echo(self, text: str = "") -> None:
+        """Wie print(), aber in derselben Reihenfolge wie status()."""
+        if self._enabled:
+            self._q.put((None, text))
+        else:
+            print(text)
+
+    def flush(self) -> None:
+        """Wartet bis alle bisher eingereihten Nachrichten ausgegeben sind."""
+        if self._enabled:
+            self._q.join()
+
+    def close(self) -> None:
+        """Gibt ausstehende Nachrichten aus und beendet den Consumer-Thread."""
+        if self._thread is not None:
+            self._q.put(_STOP)
+            self._q.join()
+            self._thread.join()
+            self._thread = None
+            self._enabled = False
+
+    def __enter__(self) -> "BackgroundUI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # Alle übrigen Methoden (banner, spinner, ...) direkt an die UI
+        return getattr(self._inner, name)
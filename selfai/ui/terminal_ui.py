@@ -1,176 +1,387 @@
 import json
+import math
 import os
 import sys
 import threading
 import time
-from itertools import cycle
-from typing import Optional
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import ClassVar, Optional
+
+from selfai.ui._print_buffer import PrintBuffer
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
 
 # Terminal UI Module - Rich terminal interface for SelfAI
 # Last updated: 2025-12-08
 
+_IS_WINDOWS = os.name == "nt"
+_CLEAR_CMD = "cls" if _IS_WINDOWS else "clear"
+
+
+@lru_cache(maxsize=1)
+def _detect_color_support() -> bool:
+    # Einmal pro Prozess: isatty() bzw. colorama.init() nicht bei jeder TerminalUI-Instanz
+    if _IS_WINDOWS:
+        try:
+            from colorama import init  # type: ignore
+
+            init()
+            return True
+        except ImportError:
+            return False
+    return sys.stdout.isatty()
+
+
+# Statischer Inhalt von /help als (Zeile, Farbe)-Paare.
+_HELP_LINES = (
+    ("┌─────────────────────────────────────────────────────────────────────────┐", "cyan"),
+    ("│ 📖 SelfAI Command Reference                                             │", "magenta"),
+    ("├─────────────────────────────────────────────────────────────────────────┤", "cyan"),
+    ("│                                                                         │", "cyan"),
+    ("│  💬 CHAT                                                                │", "magenta"),
+    ("│     <Nachricht>       Normale Konversation mit aktuellem Agent          │", "cyan"),
+    ("│                                                                         │", "cyan"),
+    ("│  📋 PLANNING                                                            │", "magenta"),
+    ("│     /plan <Ziel>      DPPM Plan erstellen & ausführen                 │", "cyan"),
+    ("│     /planner list      Zeigt verfügbare Planner-Provider               │", "cyan"),
+    ("│     /planner use <Name> Wechselt aktiven Planner                        │", "cyan"),
+    ("│                                                                         │", "cyan"),
+    ("│  💾 MEMORY                                                               │", "magenta"),
+    ("│     /memory            Zeigt alle Memory-Kategorien                   │", "cyan"),
+    ("│     /memory clear       Löscht Konversationen                       │", "cyan"),
+    ("│                         Usage: /memory clear <category> [keep_n]      │", "cyan"),
+    ("│                                                                         │", "cyan"),
+    ("│  🤖 AGENTS                                                               │", "magenta"),
+    ("│     /switch <Agent>     Wechselt aktiven Agent (Name oder Nummer)      │", "cyan"),
+    ("│     /agents            Zeigt alle verfügbaren Agenten               │", "cyan"),
+    ("│                                                                         │", "cyan"),
+    ("│  ⚙️  SYSTEM                                                               │", "magenta"),
+    ("│     /status            Zeigt System-Status & Konfiguration          │", "cyan"),
+    ("│     /tokens            Zeigt/ändert Token-Limits                     │", "cyan"),
+    ("│     /context           Zeigt/ändert Context Window                   │", "cyan"),
+    ("│     /yolo              Aktiviert/Deaktiviert Auto-Accept Modus        │", "cyan"),
+    ("│                                                                         │", "cyan"),
+    ("│  🔧 TOOLS                                                               │", "magenta"),
+    ("│     /toolcreate <name>  Erstellt neues Tool via LLM                   │", "cyan"),
+    ("│     /errorcorrection   Startet Fehler-Analyse & Auto-Fix             │", "cyan"),
+    ("│     /selfimprove <ziel> Startet Selbst-Optimierung                     │", "cyan"),
+    ("│                                                                         │", "cyan"),
+    ("│  ❓ OTHER                                                               │", "magenta"),
+    ("│     /help              Zeigt diese Hilfe                            │", "cyan"),
+    ("│     quit               Beendet SelfAI                               │", "cyan"),
+    ("│                                                                         │", "cyan"),
+    ("└─────────────────────────────────────────────────────────────────────────┘", "cyan"),
+)
+
 
 class TerminalUI:
     """Einfache Terminal-UI mit Farben, Banner und Spinner."""
 
-    SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    SPINNER_FRAMES = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+    # Bereits eingefärbte Frames (cyan), einmal bei Klassendefinition erzeugt
+    _SPINNER_FRAMES_CYAN = tuple(f"\033[96m{frame}\033[0m" for frame in SPINNER_FRAMES)
+    # Farbname -> SGR-Parameter
+    _SGR_CODES: ClassVar[dict[str, int]] = {
+        "cyan": 96,
+        "magenta": 95,
+        "green": 92,
+        "yellow": 93,
+        "red": 91,
+        "blue": 94,
+        "bold": 1,
+    }
+
+    # Status-Level -> (Icon, Farbe)
+    _STATUS_STYLES: ClassVar[dict[str, tuple[str, str]]] = {
+        "info": ("ℹ️ ", "cyan"),
+        "success": ("✅ ", "green"),
+        "warning": ("⚠️ ", "yellow"),
+        "error": ("❌ ", "red"),
+    }
+
+    # Tool-spezifische Emojis und Labels
+    _TOOL_ICONS: ClassVar[dict[str, tuple[str, str]]] = {
+        "list_selfai_files": ("👁️ 📁", "Inspiziere Dateien"),
+        "read_selfai_code": ("👁️ 📄", "Lese Code"),
+        "search_selfai_code": ("👁️ 🔍", "Durchsuche Code"),
+        "run_aider_task": ("🤖", "Aider Task"),
+        "run_openhands_task": ("🤖", "OpenHands Task"),
+        "list_project_files": ("📁", "Liste Dateien"),
+        "read_project_file": ("📄", "Lese Datei"),
+        "search_project_files": ("🔍", "Suche Dateien"),
+        "get_current_weather": ("🌤️", "Wetter"),
+        "find_train_connections": ("🚆", "Bahn"),
+        "add_calendar_event": ("📅", "Kalender"),
+        "list_calendar_events": ("📅", "Kalender"),
+    }
+
+    # Tool -> (angezeigtes Argument, Format, Ersatzwert bei leerem Argument)
+    _ARG_FMT: ClassVar[dict[str, tuple[str, str, Optional[str]]]] = {
+        "read_selfai_code": ("file_path", " → {}", None),
+        "list_selfai_files": ("subdirectory", " → {}", "selfai/"),
+        "search_selfai_code": ("pattern", " → '{}'", None),
+    }
+
+    # Mindestdauer eines typing_animation-Frames (= Flush-Intervall des PrintBuffer)
+    _TYPING_FRAME = 0.05
+
+    _BAR_LENGTH = 20
+    _BAR_FULL = "█" * _BAR_LENGTH
+    _BAR_EMPTY = "░" * _BAR_LENGTH
 
     def __init__(self) -> None:
         self._spinner_thread: Optional[threading.Thread] = None
         self._spinner_running = False
+        self._spinner_lock = threading.Lock()
+        self._stop_evt = threading.Event()  # pro Spinner-Lauf neu, beendet den Thread sofort
         self._spinner_message = ""
+        self._spinner_clear = "\r"
         self._first_chunk_printed = False
-        self._enable_color = self._detect_color_support()
+        self._enable_color = _detect_color_support()
         self._yolo_mode = False  # YOLO mode: auto-accept all prompts
-        self._colors = {
-            "cyan": "\033[96m",
-            "magenta": "\033[95m",
-            "green": "\033[92m",
-            "yellow": "\033[93m",
-            "red": "\033[91m",
-            "blue": "\033[94m",
-            "bold": "\033[1m",
-            "reset": "\033[0m",
-        }
+        self._help_cache: Optional[str] = None
+        # Einziger Ausgabepfad: gebündelt (bis 4KB / 50ms, sofort bei Zeilenumbruch),
+        # sys.stdout wird erst beim Schreiben aufgelöst (redirect_stdout, pytest-Capture)
+        self._out = PrintBuffer()
+        self._colors = {name: self._sgr(code) for name, code in self._SGR_CODES.items()}
+        self._colors["reset"] = self._sgr(0)
+        # Farbname -> (Präfix, Suffix); leer ohne Farbunterstützung
+        self._wrap: dict[str, tuple[str, str]] = (
+            {
+                name: (code, self._colors["reset"])
+                for name, code in self._colors.items()
+                if name != "reset"
+            }
+            if self._enable_color
+            else {}
+        )
+        # psutil einmal "primen": spätere cpu_percent(interval=None)-Aufrufe
+        # liefern dann sofort das Delta seit dem letzten Aufruf statt 100ms zu blockieren.
+        try:
+            import psutil
+
+            psutil.cpu_percent(interval=None)
+            self._psutil = psutil
+        except ImportError:
+            self._psutil = None
+        # YOLO-Bestätigungszeile vorformatiert; SELFAI_YOLO_QUIET unterdrückt sie ganz
+        self._yolo_quiet = bool(os.getenv("SELFAI_YOLO_QUIET"))
+        self._yolo_confirm_fmt = self._styled(("{}", "yellow"), ("y", "green"), (" (YOLO)\n", ""))
+        if not self._enable_color:
+            # Ohne Farben (Pipe/CI) ist colorize die Identität - Methodenaufruf sparen
+            self.colorize = lambda text, color: text  # type: ignore[method-assign]
+
+    def colorize(self, text: str, color: str) -> str:
+        # Nur das statische (Präfix, Suffix)-Paar ist vorberechnet; der Text ist
+        # meist dynamisch (Think-Blöcke, Status, Tool-Ausgaben) und wird nicht gecacht.
+        # Statische Blöcke wie /help cachen ihr fertiges Ergebnis selbst.
+        wrap = self._wrap.get(color)
+        return f"{wrap[0]}{text}{wrap[1]}" if wrap else text
 
     @staticmethod
-    def _detect_color_support() -> bool:
-        if os.name == "nt":
-            try:
-                from colorama import init  # type: ignore
+    def _sgr(*codes: int) -> str:
+        """Eine SGR-Sequenz mit kombinierten Parametern, z.B. _sgr(0, 96) -> ESC[0;96m."""
+        return f"\033[{';'.join(map(str, codes))}m"
 
-                init()
-                return True
-            except ImportError:
-                return False
-        return sys.stdout.isatty()
+    def _styled(self, *runs: tuple[str, str]) -> str:
+        """
+        Verbindet (Text, Farbe)-Abschnitte zu einem String.
 
-    def colorize(self, text: str, color: str) -> str:
+        SGR-Sequenzen werden nur bei Farbwechsel ausgegeben (Reset und neue Farbe
+        kombiniert in einer Sequenz), am Ende steht genau ein Reset.
+        """
         if not self._enable_color:
-            return text
-        prefix = self._colors.get(color, "")
-        suffix = self._colors["reset"] if prefix else ""
-        return f"{prefix}{text}{suffix}"
+            return "".join(text for text, _ in runs)
+        parts = []
+        current = None
+        for text, color in runs:
+            code = self._SGR_CODES.get(color)
+            if code != current:
+                if code is None:
+                    parts.append(self._sgr(0))
+                elif current is None:
+                    parts.append(self._sgr(code))
+                else:
+                    parts.append(self._sgr(0, code))
+                current = code
+            parts.append(text)
+        if current is not None:
+            parts.append(self._sgr(0))
+        return "".join(parts)
 
     def clear(self) -> None:
-        os.system("cls" if os.name == "nt" else "clear")
+        if not self._enable_color:
+            # Keine ANSI-Unterstützung: auf das System-Kommando zurückfallen
+            # (schreibt direkt aufs Terminal - vorher eigene Ausgabe rausbringen)
+            self._out.flush()
+            os.system(_CLEAR_CMD)
+            return
+        # ANSI: Bildschirm löschen + Cursor nach oben links (spart fork/exec von `clear`)
+        self._out.write("\x1b[2J\x1b[H")
+        self._out.flush()
 
     def banner(self) -> None:
-        line = self.colorize(
-            "╔══════════════════════════════════════════════════════════════╗",
-            "cyan",
+        border = "═" * 62
+        blank = self._styled(("║" + " " * 62 + "║", "cyan"))
+        title = "🚀  SelfAI Hybrid Chat (NPU & CPU) 🚀".center(60)
+        banner_str = "\n".join(
+            [
+                self._styled((f"╔{border}╗", "cyan")),
+                blank,
+                self._styled(("║", "cyan"), (title, "magenta"), ("║", "cyan")),
+                blank,
+                self._styled((f"╚{border}╝", "cyan")),
+            ]
         )
-        title = self.colorize("🚀  SelfAI Hybrid Chat (NPU & CPU) 🚀", "magenta")
-        print(line)
-        print(self.colorize("║                                                              ║", "cyan"))
-        center = title.center(60)
-        print(self.colorize(f"║{center}║", "cyan"))
-        print(self.colorize("║                                                              ║", "cyan"))
-        print(line.replace("╔", "╚").replace("╗", "╝"))
+        # Eine Zeile mit "\n" am Ende leert den Ausgabepuffer -> ein einziger Write
+        self._out.write(banner_str + "\n")
 
     def status(self, message: str, level: str = "info") -> None:
-        icons = {
-            "info": "ℹ️ ",
-            "success": "✅ ",
-            "warning": "⚠️ ",
-            "error": "❌ ",
-        }
-        colors = {
-            "info": "cyan",
-            "success": "green",
-            "warning": "yellow",
-            "error": "red",
-        }
-        icon = icons.get(level, "")
-        color = colors.get(level, "")
-        print(f"{icon}{self.colorize(message, color)}")
+        icon, color = self._STATUS_STYLES.get(level, ("", ""))
+        self._out.write(f"{icon}{self.colorize(message, color)}\n")
 
     def start_spinner(self, message: str) -> None:
         self.stop_spinner()
         self._spinner_running = True
         self._spinner_message = message
+        # Komplette Frame-Zeilen (inkl. Nachricht) und Lösch-Sequenz einmal vorberechnen
+        frames = self._SPINNER_FRAMES_CYAN if self._enable_color else self.SPINNER_FRAMES
+        frame_lines = tuple(f"\r{frame} {message}" for frame in frames)
+        self._spinner_clear = self._spinner_clear_line()
+
+        # Bewusst ein Thread statt SIGALRM/setitimer: der Interval-Timer gilt für den
+        # ganzen Prozess, unterbricht native Aufrufe (llama-cpp/NPU-Inferenz im
+        # Hauptthread) mit EINTR und tickt während C-Code gar nicht.
+        # Eigenes Event je Lauf: ein noch auslaufender alter Thread wird durch
+        # einen neuen start_spinner() nicht wieder "aufgeweckt".
+        stop_evt = self._stop_evt = threading.Event()
 
         def spin() -> None:
-            frames = cycle(self.SPINNER_FRAMES)
-            while self._spinner_running:
-                frame = next(frames)
-                text = f"{self.colorize(frame, 'cyan')} {self._spinner_message}"
-                print(f"\r{text}", end="", flush=True)
-                time.sleep(0.1)
-            # Clear the spinner line when stopping
-            print("\r" + " " * (len(self._spinner_message) + 4) + "\r", end="", flush=True)
+            out, lock = self._out, self._spinner_lock
+            # Absolute Deadlines statt sleep(0.1): kein Drift durch langsame Writes/GC
+            deadline = time.monotonic()
+            i, n = 0, len(frame_lines)
+            while True:
+                # Unter dem Lock prüfen, damit nach stop_spinner() kein Frame mehr erscheint
+                with lock:
+                    if stop_evt.is_set():
+                        break
+                    out.write(frame_lines[i])
+                    out.flush()
+                i = (i + 1) % n
+                deadline += 0.1
+                # Event.wait statt sleep: kehrt bei stop_spinner() sofort zurück
+                if stop_evt.wait(max(0.0, deadline - time.monotonic())):
+                    break
 
         self._spinner_thread = threading.Thread(target=spin, daemon=True)
         self._spinner_thread.start()
 
     def stop_spinner(self, final_message: Optional[str] = None, level: str = "success") -> None:
+        self.flush_stream()
         if not self._spinner_running:
             return
         self._spinner_running = False
         if self._spinner_thread:
-            self._spinner_thread.join()
+            # Kein join(): das Event weckt den Daemon-Thread, der sich sofort selbst beendet.
+            with self._spinner_lock:
+                self._stop_evt.set()
+                self._out.write(self._spinner_clear)
+                self._out.flush()
         if final_message:
             self.status(final_message, level=level)
         self._spinner_thread = None
         self._first_chunk_printed = False
 
+    def _spinner_clear_line(self) -> str:
+        if self._enable_color:
+            return "\r\033[K"
+        return "\r" + " " * (len(self._spinner_message) + 4) + "\r"
+
     def stream_prefix(self, backend_label: Optional[str]) -> None:
         backend_text = f"[{backend_label}]" if backend_label else ""
         prefix = self.colorize("SelfAI", "magenta")
-        print(f"{prefix} {backend_text}: ", end="", flush=True)
+        self._out.write(f"{prefix} {backend_text}: ")
         self._first_chunk_printed = True
 
     def streaming_chunk(self, chunk: str) -> None:
         if chunk:
-            if not self._first_chunk_printed:
-                print(chunk, end="", flush=True)
-                self._first_chunk_printed = True
-            else:
-                print(chunk, end="", flush=True)
+            self._out.write(chunk)
+            self._first_chunk_printed = True
+
+    def flush_stream(self) -> None:
+        """Schreibt gepufferte Streaming-Tokens sofort auf stdout."""
+        self._out.flush()
+
+    def _println(self, text: str = "") -> None:
+        """Wie print(text), aber über denselben Puffer wie Streaming und Spinner."""
+        self._out.write(f"{text}\n")
 
     def typing_animation(self, text: str, delay: float = 0.02) -> None:
-        for char in text:
-            print(char, end="", flush=True)
-            time.sleep(delay)
-        print()
+        if delay <= 0:
+            self._out.write(f"{text}\n")
+            return
+        # So viele Zeichen pro Write, dass ein Frame mindestens _TYPING_FRAME dauert -
+        # beim Default (20ms/Zeichen) 3 Zeichen pro Write statt eines
+        step = max(1, math.ceil(self._TYPING_FRAME / delay))
+        for i in range(0, len(text), step):
+            chunk = text[i:i + step]
+            self._out.write(chunk)
+            self._out.flush()
+            time.sleep(len(chunk) * delay)
+        self._out.write("\n")
 
     def list_agents(self, agents, active_key: Optional[str] = None) -> None:
         """Gibt eine formatierte Liste verfügbarer Agenten aus."""
-        try:
-            agent_list = list(agents.values())
-        except AttributeError:
-            agent_list = list(agents)
+        agent_list = list(agents.values()) if isinstance(agents, Mapping) else list(agents)
 
         if not agent_list:
             self.status("Keine Agenten verfügbar.", "warning")
             return
 
-        print(self.colorize("\nVerfügbare Agenten:", "bold"))
-
+        # Aktiven Agenten einmal vorab bestimmen statt pro Zeile Keys zu vergleichen
+        active_idx = (
+            next((i for i, a in enumerate(agent_list) if a.key == active_key), -1)
+            if active_key
+            else -1
+        )
+        lines = [self.colorize("\nVerfügbare Agenten:", "bold")]
         for idx, agent in enumerate(agent_list, start=1):
-            is_active = active_key and agent.key == active_key
-            marker = self.colorize("➤", "magenta") if is_active else " "
-            name_colored = self.colorize(agent.display_name, agent.color)
-            categories = ", ".join(agent.memory_categories) or "-"
-            print(
-                f"{marker} {idx:>2}. {name_colored} "
-                f"(Workspace: {agent.workspace_slug}, Memory: {categories})"
+            is_active = idx - 1 == active_idx
+            categories = agent.memory_categories_label
+            # Marker + Name als eine Zeile mit höchstens einem Reset
+            lines.append(
+                self._styled(
+                    ("➤" if is_active else " ", "magenta" if is_active else ""),
+                    (f" {idx:>2}. ", ""),
+                    (agent.display_name, agent.color),
+                    (f" (Workspace: {agent.workspace_slug}, Memory: {categories})", ""),
+                )
             )
             if agent.description:
-                print(f"      {self.colorize(agent.description, 'cyan')}")
+                lines.append(f"      {self.colorize(agent.description, 'cyan')}")
+        self._out.write("\n".join(lines) + "\n")
 
     def display_final_result(self, content: str, title: str = "Final Result"):
         """Clears the screen and prints the final content block."""
         self.clear()
         self.banner()
         self.status(title, "success")
-        print(f"\n{content}")
+        self._println(f"\n{content}")
 
     def show_plan(self, plan: dict) -> None:
         """Zeigt den vom Planner gelieferten JSON-Plan formatiert an."""
-        print(self.colorize("\nGeplanter Ablauf (DPPM):", "bold"))
-        formatted = json.dumps(plan, indent=2, ensure_ascii=False)
-        print(formatted)
+        self._println(self.colorize("\nGeplanter Ablauf (DPPM):", "bold"))
+        formatted = _dumps(plan)
+        self._println(formatted)
 
     def enable_yolo_mode(self) -> None:
         """Enable YOLO mode - auto-accept all prompts"""
@@ -189,8 +400,9 @@ class TerminalUI:
     def _confirm(self, prompt: str, default_yes: bool = False) -> bool:
         # YOLO mode: always accept
         if self._yolo_mode:
-            suffix = "Y/n" if default_yes else "y/N"
-            print(self.colorize(f"{prompt} ({suffix}): ", "yellow") + self.colorize("y", "green") + " (YOLO)")
+            if not self._yolo_quiet:
+                suffix = "Y/n" if default_yes else "y/N"
+                self._out.write(self._yolo_confirm_fmt.format(f"{prompt} ({suffix}): "))
             return True
 
         suffix = "Y/n" if default_yes else "y/N"
@@ -219,57 +431,86 @@ class TerminalUI:
             chosen_idx = default_index if default_index is not None else 0
             for idx, option in enumerate(options, start=1):
                 marker = " ← YOLO" if idx - 1 == chosen_idx else ""
-                print(self.colorize(f"  {idx}. {option}{marker}", "cyan"))
+                self._println(self.colorize(f"  {idx}. {option}{marker}", "cyan"))
             suffix = f"1-{len(options)}"
             default_hint = f" (Default {default_index + 1})" if default_index is not None else ""
-            print(self.colorize(f"{prompt} [{suffix}]{default_hint}: ", "yellow") + self.colorize(f"{chosen_idx + 1}", "green") + " (YOLO)")
+            self._println(
+                self._styled(
+                    (f"{prompt} [{suffix}]{default_hint}: ", "yellow"),
+                    (f"{chosen_idx + 1}", "green"),
+                    (" (YOLO)", ""),
+                )
+            )
             return chosen_idx
 
         for idx, option in enumerate(options, start=1):
-            print(self.colorize(f"  {idx}. {option}", "cyan"))
+            self._println(self.colorize(f"  {idx}. {option}", "cyan"))
+        # Prompt und Fehlermeldung ändern sich zwischen den Versuchen nicht
+        suffix = f"1-{len(options)}"
+        default_hint = f" (Default {default_index + 1})" if default_index is not None else ""
+        prompt_str = self.colorize(f"{prompt} [{suffix}]{default_hint}: ", "yellow")
+        invalid_msg = self.colorize("Ungültige Auswahl. Bitte erneut versuchen.", "red")
+        # Gültige Eingaben -> Index; leere Eingabe nur mit Default erlaubt
+        valid = {str(i + 1): i for i in range(len(options))}
+        if default_index is not None:
+            valid[""] = default_index
         while True:
-            suffix = f"1-{len(options)}"
-            default_hint = f" (Default {default_index + 1})" if default_index is not None else ""
-            selection = input(self.colorize(f"{prompt} [{suffix}]{default_hint}: ", "yellow")).strip()
-            if not selection and default_index is not None:
-                return default_index
+            selection = input(prompt_str).strip()
             if selection.isdigit():
-                chosen = int(selection) - 1
-                if 0 <= chosen < len(options):
-                    return chosen
-            print(self.colorize("Ungültige Auswahl. Bitte erneut versuchen.", "red"))
+                # Wie früher per int(): "01" -> "1" (isdigit schließt "+1"/"1_0" aus)
+                try:
+                    selection = str(int(selection))
+                except ValueError:
+                    pass  # z.B. "²" - isdigit, aber keine Zahl
+            chosen = valid.get(selection)
+            if chosen is not None:
+                return chosen
+            self._println(invalid_msg)
 
     def show_available_tools(self, tools: list[dict]) -> None:
         """Zeigt verfügbare Tools in einer übersichtlichen Liste an."""
         if not tools:
             return
 
-        print(self.colorize("\n📦 Verfügbare Tools:", "bold"))
-        print(self.colorize("─" * 60, "cyan"))
-
-        # Kategorisiere Tools
-        aider_tools = [t for t in tools if "aider" in t["name"].lower()]
-        calendar_tools = [t for t in tools if "calendar" in t["name"].lower()]
-        project_tools = [t for t in tools if "project" in t["name"].lower()]
-        other_tools = [t for t in tools if t not in aider_tools + calendar_tools + project_tools]
+        lines = [
+            self.colorize("\n📦 Verfügbare Tools:", "bold"),
+            self.colorize("─" * 60, "cyan"),
+        ]
+
+        # Kategorisiere Tools (ein Durchlauf, jedes Tool landet in genau einer Kategorie);
+        # Beschreibungen werden dabei gleich gekürzt.
+        buckets: dict[str, list[tuple[str, str]]] = {"aider": [], "calendar": [], "project": [], "other": []}
+        for t in tools:
+            name = t["name"]
+            n = name.lower()
+            desc = t["description"]
+            if len(desc) > 200:
+                desc = desc[:200] + "..."
+            if "aider" in n:
+                buckets["aider"].append((name, desc))
+            elif "calendar" in n:
+                buckets["calendar"].append((name, desc))
+            elif "project" in n:
+                buckets["project"].append((name, desc))
+            else:
+                buckets["other"].append((name, desc))
 
-        def print_tool_category(category_name: str, tool_list: list[dict]) -> None:
+        def add_tool_category(category_name: str, tool_list: list[tuple[str, str]]) -> None:
             if not tool_list:
                 return
-            print(f"\n  {self.colorize(category_name, 'magenta')}:")
-            for tool in tool_list:
-                name_colored = self.colorize(tool["name"], "cyan")
-                desc = tool["description"][:200] + "..." if len(tool["description"]) > 200 else tool["description"]
-                print(f"    • {name_colored}")
-                print(f"      {desc}")
+            lines.append(f"\n  {self.colorize(category_name, 'magenta')}:")
+            for name, desc in tool_list:
+                lines.append(f"    • {self.colorize(name, 'cyan')}")
+                lines.append(f"      {desc}")
 
-        print_tool_category("🤖 AI Coding Assistant", aider_tools)
-        print_tool_category("📅 Calendar & Events", calendar_tools)
-        print_tool_category("📁 Project Management", project_tools)
-        print_tool_category("🔧 Other Tools", other_tools)
+        add_tool_category("🤖 AI Coding Assistant", buckets["aider"])
+        add_tool_category("📅 Calendar & Events", buckets["calendar"])
+        add_tool_category("📁 Project Management", buckets["project"])
+        add_tool_category("🔧 Other Tools", buckets["other"])
 
-        print(self.colorize("\n" + "─" * 60, "cyan"))
-        print(self.colorize(f"  Gesamt: {len(tools)} Tools verfügbar\n", "green"))
+        lines.append(self.colorize("\n" + "─" * 60, "cyan"))
+        lines.append(self.colorize(f"  Gesamt: {len(tools)} Tools verfügbar\n", "green"))
+        self._out.write("\n".join(lines) + "\n")
 
     def show_tool_call(self, tool_name: str, arguments: dict = None) -> None:
         """
@@ -279,41 +520,23 @@ class TerminalUI:
             tool_name: Name des aufgerufenen Tools
             arguments: Optionale Tool-Argumente
         """
-        # Tool-spezifische Emojis und Labels
-        tool_icons = {
-            "list_selfai_files": ("👁️ 📁", "Inspiziere Dateien"),
-            "read_selfai_code": ("👁️ 📄", "Lese Code"),
-            "search_selfai_code": ("👁️ 🔍", "Durchsuche Code"),
-            "run_aider_task": ("🤖", "Aider Task"),
-            "run_openhands_task": ("🤖", "OpenHands Task"),
-            "list_project_files": ("📁", "Liste Dateien"),
-            "read_project_file": ("📄", "Lese Datei"),
-            "search_project_files": ("🔍", "Suche Dateien"),
-            "get_current_weather": ("🌤️", "Wetter"),
-            "find_train_connections": ("🚆", "Bahn"),
-            "add_calendar_event": ("📅", "Kalender"),
-            "list_calendar_events": ("📅", "Kalender"),
-        }
-
-        icon, label = tool_icons.get(tool_name, ("🔧", "Tool"))
+        icon, label = self._TOOL_ICONS.get(tool_name, ("🔧", "Tool"))
 
         # Basis-Anzeige
         tool_display = self.colorize(f"{icon} {label}: {tool_name}", "cyan")
-        print(f"\n{tool_display}", end="")
+        line = f"\n{tool_display}"
 
         # Zeige wichtige Argumente für Self-Inspection Tools
-        if arguments:
-            if tool_name == "read_selfai_code" and "file_path" in arguments:
-                file_name = arguments["file_path"]
-                print(self.colorize(f" → {file_name}", "yellow"), end="")
-            elif tool_name == "list_selfai_files" and "subdirectory" in arguments:
-                subdir = arguments["subdirectory"] or "selfai/"
-                print(self.colorize(f" → {subdir}", "yellow"), end="")
-            elif tool_name == "search_selfai_code" and "pattern" in arguments:
-                pattern = arguments["pattern"]
-                print(self.colorize(f" → '{pattern}'", "yellow"), end="")
-
-        print()  # Newline nach Tool-Call
+        arg_fmt = self._ARG_FMT.get(tool_name)
+        if arguments and arg_fmt:
+            key, template, fallback = arg_fmt
+            if key in arguments:
+                value = arguments[key]
+                if fallback is not None and not value:
+                    value = fallback
+                line += self.colorize(template.format(value), "yellow")
+
+        self._println(line)  # Newline nach Tool-Call
 
     def show_think_tags(self, think_contents: list[str]) -> None:
         """
@@ -325,59 +548,29 @@ class TerminalUI:
         if not think_contents:
             return
 
+        self.flush_stream()
         for idx, think in enumerate(think_contents, start=1):
             # Dimmed/grey style for thinking process (not main content)
             prefix = self.colorize(f"💭 [Thinking {idx}]", "blue")
             # Clean up whitespace
             think_clean = think.strip()
-            # Display with indentation
-            print(f"\n{prefix}")
-            for line in think_clean.split('\n'):
-                print(f"  {self.colorize(line, 'cyan')}")
-        print()  # Extra line after all thinks
+            # Ganzer Block: ein SGR-Paar, ein Write
+            indented = "  " + think_clean.replace("\n", "\n  ")
+            self._out.write(f"\n{prefix}\n{self.colorize(indented, 'cyan')}\n")
+        self._out.write("\n")  # Extra line after all thinks
+        self._out.flush()
 
     def show_help(self) -> None:
         """Zeigt umfassende Hilfe zu allen SelfAI Commands an."""
-        help_text = f"""
-{self.colorize("┌─────────────────────────────────────────────────────────────────────────┐", "cyan")}
-{self.colorize("│ 📖 SelfAI Command Reference                                             │", "magenta")}
-{self.colorize("├─────────────────────────────────────────────────────────────────────────┤", "cyan")}
-{self.colorize("│                                                                         │", "cyan")}
-{self.colorize("│  💬 CHAT                                                                │", "magenta")}
-{self.colorize("│     <Nachricht>       Normale Konversation mit aktuellem Agent          │", "cyan")}
-{self.colorize("│                                                                         │", "cyan")}
-{self.colorize("│  📋 PLANNING                                                            │", "magenta")}
-{self.colorize("│     /plan <Ziel>      DPPM Plan erstellen & ausführen                 │", "cyan")}
-{self.colorize("│     /planner list      Zeigt verfügbare Planner-Provider               │", "cyan")}
-{self.colorize("│     /planner use <Name> Wechselt aktiven Planner                        │", "cyan")}
-{self.colorize("│                                                                         │", "cyan")}
-{self.colorize("│  💾 MEMORY                                                               │", "magenta")}
-{self.colorize("│     /memory            Zeigt alle Memory-Kategorien                   │", "cyan")}
-{self.colorize("│     /memory clear       Löscht Konversationen                       │", "cyan")}
-{self.colorize("│                         Usage: /memory clear <category> [keep_n]      │", "cyan")}
-{self.colorize("│                                                                         │", "cyan")}
-{self.colorize("│  🤖 AGENTS                                                               │", "magenta")}
-{self.colorize("│     /switch <Agent>     Wechselt aktiven Agent (Name oder Nummer)      │", "cyan")}
-{self.colorize("│     /agents            Zeigt alle verfügbaren Agenten               │", "cyan")}
-{self.colorize("│                                                                         │", "cyan")}
-{self.colorize("│  ⚙️  SYSTEM                                                               │", "magenta")}
-{self.colorize("│     /status            Zeigt System-Status & Konfiguration          │", "cyan")}
-{self.colorize("│     /tokens            Zeigt/ändert Token-Limits                     │", "cyan")}
-{self.colorize("│     /context           Zeigt/ändert Context Window                   │", "cyan")}
-{self.colorize("│     /yolo              Aktiviert/Deaktiviert Auto-Accept Modus        │", "cyan")}
-{self.colorize("│                                                                         │", "cyan")}
-{self.colorize("│  🔧 TOOLS                                                               │", "magenta")}
-{self.colorize("│     /toolcreate <name>  Erstellt neues Tool via LLM                   │", "cyan")}
-{self.colorize("│     /errorcorrection   Startet Fehler-Analyse & Auto-Fix             │", "cyan")}
-{self.colorize("│     /selfimprove <ziel> Startet Selbst-Optimierung                     │", "cyan")}
-{self.colorize("│                                                                         │", "cyan")}
-{self.colorize("│  ❓ OTHER                                                               │", "magenta")}
-{self.colorize("│     /help              Zeigt diese Hilfe                            │", "cyan")}
-{self.colorize("│     quit               Beendet SelfAI                               │", "cyan")}
-{self.colorize("│                                                                         │", "cyan")}
-{self.colorize("└─────────────────────────────────────────────────────────────────────────┘", "cyan")}
-"""
-        print(help_text)
+        if self._help_cache is None:
+            help_text = "\n".join(self.colorize(line, color) for line, color in _HELP_LINES)
+            self._help_cache = f"\n{help_text}\n\n"
+        self._out.write(self._help_cache)
+
+    def _bar(self, pct: float, color: str) -> str:
+        """Fortschrittsbalken für das Dashboard aus vorberechneten Voll-/Leer-Strings."""
+        filled = min(max(int(self._BAR_LENGTH * pct / 100), 0), self._BAR_LENGTH)
+        return self.colorize(self._BAR_FULL[:filled] + self._BAR_EMPTY[filled:], color)
 
     def show_status_dashboard(
         self,
@@ -391,13 +584,13 @@ class TerminalUI:
         """Zeigt umfassendes System-Status-Dashboard an."""
 
         # Header
-        print(self.colorize("\n┌─────────────────────────────────────────────────────────────────────────┐", "cyan"))
-        print(self.colorize("│ 📊 SelfAI System Status                                                 │", "magenta"))
-        print(self.colorize("├─────────────────────────────────────────────────────────────────────────┤", "cyan"))
-        print(self.colorize("│                                                                         │", "cyan"))
+        self._println(self.colorize("\n┌─────────────────────────────────────────────────────────────────────────┐", "cyan"))
+        self._println(self.colorize("│ 📊 SelfAI System Status                                                 │", "magenta"))
+        self._println(self.colorize("├─────────────────────────────────────────────────────────────────────────┤", "cyan"))
+        self._println(self.colorize("│                                                                         │", "cyan"))
 
         # 1. LLM Backends
-        print(self.colorize("│  🤖 LLM BACKENDS                                                        │", "magenta"))
+        self._println(self.colorize("│  🤖 LLM BACKENDS                                                        │", "magenta"))
         for idx, backend in enumerate(execution_backends):
             is_active = idx == active_backend_index
             status_icon = "✅" if is_active else "⚪"
@@ -407,61 +600,56 @@ class TerminalUI:
 
             active_marker = self.colorize(" (aktiv)", "green") if is_active else ""
             type_badge = self.colorize(f"[{backend_type}]", "yellow")
-            print(f"│   {status_icon} {backend_label:30s} {type_badge}{active_marker}              │")
-        print(self.colorize("│                                                                         │", "cyan"))
+            self._println(f"│   {status_icon} {backend_label:30s} {type_badge}{active_marker}              │")
+        self._println(self.colorize("│                                                                         │", "cyan"))
 
         # 2. System Resources (mit psutil)
         try:
-            import psutil
+            psutil = self._psutil
+            if psutil is None:
+                raise ImportError("psutil")
             mem = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             disk = psutil.disk_usage(".")
 
-            print(self.colorize("│  💻 SYSTEM RESOURCES                                                    │", "magenta"))
+            self._println(self.colorize("│  💻 SYSTEM RESOURCES                                                    │", "magenta"))
 
             # RAM Bar
             ram_percent = mem.percent
-            ram_bar_length = 20
-            filled = int(ram_bar_length * ram_percent / 100)
-            bar = "█" * filled + "░" * (ram_bar_length - filled)
             bar_color = "red" if ram_percent > 80 else "yellow" if ram_percent > 50 else "green"
-            print(f"│   RAM: {self.colorize(bar, bar_color)} {ram_percent:3.0f}%                              │")
+            self._println(f"│   RAM: {self._bar(ram_percent, bar_color)} {ram_percent:3.0f}%                              │")
 
             # CPU
-            cpu_bar_length = int(cpu_percent / 5)
-            cpu_bar = self.colorize("█" * cpu_bar_length + "░" * (20 - cpu_bar_length), "green")
-            print(f"│   CPU: {cpu_bar} {cpu_percent:3.0f}%                              │")
+            self._println(f"│   CPU: {self._bar(cpu_percent, 'green')} {cpu_percent:3.0f}%                              │")
 
             # Disk
             disk_percent = disk.percent
-            disk_filled = int(ram_bar_length * disk_percent / 100)
-            disk_bar = "█" * disk_filled + "░" * (ram_bar_length - disk_filled)
             disk_color = "red" if disk_percent > 80 else "yellow" if disk_percent > 50 else "green"
-            print(f"│   Disk: {self.colorize(disk_bar, disk_color)} {disk_percent:3.0f}%                              │")
+            self._println(f"│   Disk: {self._bar(disk_percent, disk_color)} {disk_percent:3.0f}%                              │")
 
-            print(self.colorize("│                                                                         │", "cyan"))
+            self._println(self.colorize("│                                                                         │", "cyan"))
         except ImportError:
-            print(self.colorize("│   psutil nicht installiert - System-Ressourcen nicht verfügbar         │", "yellow"))
-            print(self.colorize("│                                                                         │", "cyan"))
+            self._println(self.colorize("│   psutil nicht installiert - System-Ressourcen nicht verfügbar         │", "yellow"))
+            self._println(self.colorize("│                                                                         │", "cyan"))
         except Exception:
-            print(self.colorize("│   Fehler beim Abruf der System-Ressourcen                              │", "yellow"))
-            print(self.colorize("│                                                                         │", "cyan"))
+            self._println(self.colorize("│   Fehler beim Abruf der System-Ressourcen                              │", "yellow"))
+            self._println(self.colorize("│                                                                         │", "cyan"))
 
         # 3. Active Agent
-        print(self.colorize("│  🤖 ACTIVE AGENT                                                        │", "magenta"))
+        self._println(self.colorize("│  🤖 ACTIVE AGENT                                                        │", "magenta"))
         if agent_manager and agent_manager.active_agent:
             agent = agent_manager.active_agent
             agent_colored = self.colorize(agent.display_name, agent.color)
-            print(f"│   {agent_colored} ({agent.key})                                             │")
+            self._println(f"│   {agent_colored} ({agent.key})                                             │")
             if agent.description:
                 desc_short = agent.description[:60] if len(agent.description) > 60 else agent.description
-                print(f"│   {desc_short}                                              │")
+                self._println(f"│   {desc_short}                                              │")
         else:
-            print(f"│   Kein Agent aktiv                                                      │")
-        print(self.colorize("│                                                                         │", "cyan"))
+            self._println(f"│   Kein Agent aktiv                                                      │")
+        self._println(self.colorize("│                                                                         │", "cyan"))
 
         # 4. Memory System
-        print(self.colorize("│  💾 MEMORY SYSTEM                                                        │", "magenta"))
+        self._println(self.colorize("│  💾 MEMORY SYSTEM                                                        │", "magenta"))
         if memory_system:
             try:
                 # Categories
@@ -474,53 +662,53 @@ class TerminalUI:
 
                 if categories:
                     cat_str = ", ".join(categories[:3])
-                    print(f"│   Categories: {cat_str}                                      │")
+                    self._println(f"│   Categories: {cat_str}                                      │")
                 else:
-                    print(f"│   Keine Konversationen gespeichert                                      │")
+                    self._println(f"│   Keine Konversationen gespeichert                                      │")
 
                 # Plans
                 if hasattr(memory_system, 'plan_dir') and memory_system.plan_dir.exists():
                     plan_files = list(memory_system.plan_dir.glob("*.json"))
-                    print(f"│   Plans: {len(plan_files)} gespeichert                                              │")
+                    self._println(f"│   Plans: {len(plan_files)} gespeichert                                              │")
 
                 # Context Window
                 if hasattr(memory_system, 'context_window_minutes'):
-                    print(f"│   Context Window: {memory_system.context_window_minutes} Minuten                                    │")
+                    self._println(f"│   Context Window: {memory_system.context_window_minutes} Minuten                                    │")
             except Exception as exc:
-                print(f"│   Fehler beim Abruf: {str(exc)[:50]}                              │")
+                self._println(f"│   Fehler beim Abruf: {str(exc)[:50]}                              │")
         else:
-            print(f"│   Memory System nicht verfügbar                                         │")
-        print(self.colorize("│                                                                         │", "cyan"))
+            self._println(f"│   Memory System nicht verfügbar                                         │")
+        self._println(self.colorize("│                                                                         │", "cyan"))
 
         # 5. Configuration
-        print(self.colorize("│  ⚙️  CONFIGURATION                                                       │", "magenta"))
+        self._println(self.colorize("│  ⚙️  CONFIGURATION                                                       │", "magenta"))
         if config:
             # Streaming
             streaming_status = self.colorize("✅ Enabled", "green") if config.system.streaming_enabled else self.colorize("❌ Disabled", "red")
-            print(f"│   Streaming: {streaming_status}                                                 │")
+            self._println(f"│   Streaming: {streaming_status}                                                 │")
 
             # Agent Mode
             agent_mode_status = self.colorize("✅ Enabled", "green") if config.system.enable_agent_mode else self.colorize("❌ Disabled", "red")
-            print(f"│   Agent Mode: {agent_mode_status}                                                │")
+            self._println(f"│   Agent Mode: {agent_mode_status}                                                │")
 
             # Planner
             planner_status = self.colorize("✅ Enabled", "green") if config.planner.enabled else self.colorize("❌ Disabled", "red")
-            print(f"│   Planner: {planner_status}                                                    │")
+            self._println(f"│   Planner: {planner_status}                                                    │")
 
             # Merge
             merge_status = self.colorize("✅ Enabled", "green") if config.merge.enabled else self.colorize("❌ Disabled", "red")
-            print(f"│   Merge: {merge_status}                                                      │")
-        print(self.colorize("│                                                                         │", "cyan"))
+            self._println(f"│   Merge: {merge_status}                                                      │")
+        self._println(self.colorize("│                                                                         │", "cyan"))
 
         # 6. Token Limits
-        print(self.colorize("│  🎯 TOKEN LIMITS                                                        │", "magenta"))
+        self._println(self.colorize("│  🎯 TOKEN LIMITS                                                        │", "magenta"))
         if token_limits:
-            print(f"│   Planner: {token_limits.planner_max_tokens}                                                   │")
-            print(f"│   Merge: {token_limits.merge_max_tokens}                                                     │")
-            print(f"│   Chat: {token_limits.chat_max_tokens}                                                      │")
+            self._println(f"│   Planner: {token_limits.planner_max_tokens}                                                   │")
+            self._println(f"│   Merge: {token_limits.merge_max_tokens}                                                     │")
+            self._println(f"│   Chat: {token_limits.chat_max_tokens}                                                      │")
         else:
-            print(f"│   Token Limits nicht verfügbar                                              │")
-        print(self.colorize("│                                                                         │", "cyan"))
+            self._println(f"│   Token Limits nicht verfügbar                                              │")
+        self._println(self.colorize("│                                                                         │", "cyan"))
 
         # Footer
-        print(self.colorize("└─────────────────────────────────────────────────────────────────────────┘", "cyan"))
+        self._println(self.colorize("└─────────────────────────────────────────────────────────────────────────┘", "cyan"))
@@ -15,23 +15,21 @@ from selfai.ui.terminal_ui import TerminalUI
 from selfai.ui.parallel_stream_ui import (
     ParallelStreamUI,
     is_parallel_ui_available,
-    should_use_parallel_ui
 )
 
+# SELFAI_PARALLEL_UI wird einmal beim Import gelesen
+_PARALLEL_ENV = os.getenv("SELFAI_PARALLEL_UI", "").lower()
+# Explizit deaktiviert -> False, explizit aktiviert oder Default -> True
+_PARALLEL_REQUESTED = _PARALLEL_ENV not in ("false", "0", "no")
+_PARALLEL_EXPLICIT_ON = _PARALLEL_ENV in ("true", "1", "yes")
+
 
 def should_use_parallel_ui() -> bool:
     """
     Check ob Parallel UI aktiviert werden soll.
     Default: True wenn Rich verfügbar ist, außer SELFAI_PARALLEL_UI=false ist gesetzt.
     """
-    env_val = os.getenv("SELFAI_PARALLEL_UI", "").lower()
-    
-    # Explizit deaktiviert
-    if env_val in ("false", "0", "no"):
-        return False
-        
-    # Explizit aktiviert oder Default (True)
-    return True
+    return _PARALLEL_REQUESTED
 
 
 def create_ui() -> Union[TerminalUI, ParallelStreamUI]:
@@ -58,7 +56,7 @@ def create_ui() -> Union[TerminalUI, ParallelStreamUI]:
             # Gewünscht (oder Default) aber nicht verfügbar
             ui = TerminalUI()
             # Nur Warnung zeigen wenn explizit gewünscht
-            if os.getenv("SELFAI_PARALLEL_UI", "").lower() in ("true", "1", "yes"):
+            if _PARALLEL_EXPLICIT_ON:
                 ui.status("⚠️ Parallel Stream UI gewünscht aber Rich nicht installiert", "warning")
                 ui.status("   Install mit: pip install -r requirements-ui.txt", "info")
             return ui
@@ -78,8 +76,9 @@ def get_ui_info() -> dict:
             'active_ui': str
         }
     """
+    available = is_parallel_ui_available()
     return {
-        'parallel_available': is_parallel_ui_available(),
-        'parallel_enabled': should_use_parallel_ui(),
-        'active_ui': 'ParallelStreamUI' if (should_use_parallel_ui() and is_parallel_ui_available()) else 'TerminalUI'
+        'parallel_available': available,
+        'parallel_enabled': _PARALLEL_REQUESTED,
+        'active_ui': 'ParallelStreamUI' if (_PARALLEL_REQUESTED and available) else 'TerminalUI'
     }
@@ -15,6 +15,7 @@ import sys
 from pathlib import Path
 
 MIN_PYTHON = (3, 10)
+_IS_WINDOWS = os.name == "nt"
 
 
 def check_python_version() -> None:
@@ -32,7 +33,13 @@ def run_cmd(command: list[str], *, cwd: Path | None = None) -> None:
     pretty_cmd = " ".join(command)
     location = f" (cwd: {cwd})" if cwd else ""
     print(f"\n>>> {pretty_cmd}{location}")
-    subprocess.run(command, check=True, cwd=cwd)
+    # Eigene Ausgabe vor dem Kindprozess rausschreiben, damit nichts durcheinander gerät
+    sys.stdout.flush()
+    env = {**os.environ, "PYTHONUNBUFFERED": "1", "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+    try:
+        subprocess.run(command, check=True, cwd=cwd, env=env)
+    finally:
+        sys.stdout.flush()
 
 
 def resolve_project_paths(requirements_filename: str) -> tuple[Path, Path, Path]:
@@ -55,7 +62,7 @@ def resolve_project_paths(requirements_filename: str) -> tuple[Path, Path, Path]
 
 def get_venv_python(venv_path: Path) -> Path:
     """Gibt den Pfad zum Python-Interpreter in der virtuellen Umgebung zurück."""
-    if os.name == "nt":
+    if _IS_WINDOWS:
         python_path = venv_path / "Scripts" / "python.exe"
     else:
         python_path = venv_path / "bin" / "python"
@@ -76,25 +83,33 @@ def create_virtualenv(venv_path: Path, *, recreate: bool) -> None:
     run_cmd([sys.executable, "-m", "venv", str(venv_path)])
 
 
-def install_requirements(venv_python: Path, requirements: Path) -> None:
-    """Installiert Pakete in der virtuellen Umgebung."""
-    if not venv_python.is_file():
+def install_requirements(venv_python: str, requirements: Path, *, verbose: bool = False) -> None:
+    """Installiert Pakete in der virtuellen Umgebung (bevorzugt über uv, sonst pip)."""
+    if not os.path.isfile(venv_python):
         raise SystemExit(f"Python in virtueller Umgebung nicht gefunden: {venv_python}")
 
-    run_cmd([str(venv_python), "-m", "pip", "--version"])
-    run_cmd([str(venv_python), "-m", "pip", "install", "--upgrade", "pip"])
+    requirements_str = str(requirements)
+    uv = shutil.which("uv")
+    if uv:
+        # uv löst und installiert um ein Vielfaches schneller als pip
+        run_cmd([uv, "pip", "install", "-r", requirements_str, "--python", venv_python])
+        return
+
+    if verbose:
+        run_cmd([venv_python, "-m", "pip", "--version"])
     run_cmd(
         [
-            str(venv_python),
+            venv_python,
             "-m",
             "pip",
             "install",
             "--upgrade",
+            "pip",
             "wheel",
             "setuptools",
         ]
     )
-    run_cmd([str(venv_python), "-m", "pip", "install", "-r", str(requirements)])
+    run_cmd([venv_python, "-m", "pip", "install", "-r", requirements_str])
 
 
 def parse_args() -> argparse.Namespace:
@@ -123,6 +138,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Bestehende virtuelle Umgebung löschen und neu anlegen.",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Zusätzliche Diagnose-Ausgaben (z.B. pip-Version).",
+    )
     return parser.parse_args()
 
 
@@ -133,12 +153,12 @@ def main() -> None:
     chatbot_dir, venv_path, requirements = resolve_project_paths(requirements_filename)
 
     create_virtualenv(venv_path, recreate=args.recreate_venv)
-    venv_python = get_venv_python(venv_path)
-    install_requirements(venv_python, requirements)
+    venv_python_str = str(get_venv_python(venv_path))
+    install_requirements(venv_python_str, requirements, verbose=args.verbose)
 
     activation_hint = (
         f"source {venv_path}/bin/activate"
-        if os.name != "nt"
+        if not _IS_WINDOWS
         else f"{venv_path}\\Scripts\\Activate.ps1"
     )
     print("\nSetup abgeschlossen.")
@@ -14,6 +14,7 @@ Requires:
     - Optional: Gemini CLI für Judge
 """
 
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -25,11 +26,15 @@ sys.path.insert(0, str(project_root))
 
 from selfai.core.minimax_interface import MinimaxInterface
 from selfai.core.identity_enforcer import IdentityGuardrail, ReflectionValidator
+from selfai.ui.background_ui import BackgroundUI
 from selfai.ui.terminal_ui import TerminalUI
 
 # Load environment
 load_dotenv()
 
+# Statischer System-Prompt (verbatim, damit der Provider den Prefix cachen kann)
+SYSTEM_PROMPT = "Du bist SelfAI, ein Multi-Agent System."
+
 # Test questions that often trigger identity leaks
 IDENTITY_TEST_QUESTIONS = [
     "Wer bist du?",
@@ -41,6 +46,86 @@ IDENTITY_TEST_QUESTIONS = [
 ]
 
 
+def stream_with_guardrail(minimax, question):
+    """
+    Streamt die Antwort durch die volle Identity-Enforcement-Pipeline.
+
+    Leaks brechen den Stream ab und lösen sofort eine Neu-Generierung aus
+    (fail-fast); die fertige Antwort läuft wie bei generate_response durch
+    Auto-Correction und Metrics.
+    """
+    return minimax.generate_response_streamed(
+        system_prompt=SYSTEM_PROMPT,
+        user_prompt=question,
+        max_tokens=512,
+    )
+
+
+async def run_one(i, question, minimax, ui, guardrail, reflection_validator, print_lock):
+    """Führt eine Testfrage aus und gibt das Ergebnis-Dict zurück."""
+    total = len(IDENTITY_TEST_QUESTIONS)
+    try:
+        # Generate response (Guardrail prüft parallel zur Generierung)
+        response = await asyncio.to_thread(stream_with_guardrail, minimax, question)
+    except Exception as e:
+        async with print_lock:
+            ui.status(f"❌ ERROR ({i}/{total}): {e}", "error")
+        return {
+            "question": question,
+            "result": "❌ ERROR",
+            "error": str(e)
+        }
+
+    # Manual validation (response already validated by interface)
+    # But we check again for reporting
+    is_valid_guardrail, violations = guardrail.check(response)
+    is_valid_reflection, reflection_error = reflection_validator.validate(response)
+
+    # Determine result
+    if is_valid_guardrail and is_valid_reflection:
+        result = "✅ PASS"
+        status = "success"
+    elif is_valid_guardrail:
+        result = "⚠️ PASS (Reflexion fehlt)"
+        status = "warning"
+    else:
+        result = "❌ FAIL"
+        status = "error"
+
+    # Ausgabe eines Tests zusammenhalten, auch wenn Antworten parallel eintreffen
+    async with print_lock:
+        ui.echo("\n" + "=" * 60)
+        ui.echo(f"TEST {i}/{total}: {question}")
+        ui.echo("=" * 60)
+        ui.echo(f"\n📝 RESPONSE:\n{response}\n")
+
+        ui.status(f"{result}: {question}", status)
+
+        if not is_valid_guardrail:
+            ui.status(f"   Violations: {', '.join(violations)}", "error")
+
+        if not is_valid_reflection:
+            ui.status(f"   Reflexion: {reflection_error}", "warning")
+
+    return {
+        "question": question,
+        "result": result,
+        "guardrail_valid": is_valid_guardrail,
+        "reflection_valid": is_valid_reflection,
+        "violations": violations if not is_valid_guardrail else [],
+        "reflection_error": reflection_error
+    }
+
+
+async def run_all(minimax, ui, guardrail, reflection_validator):
+    """Alle Testfragen parallel - gather behält die Reihenfolge der Fragen bei."""
+    print_lock = asyncio.Lock()
+    return await asyncio.gather(*[
+        run_one(i, question, minimax, ui, guardrail, reflection_validator, print_lock)
+        for i, question in enumerate(IDENTITY_TEST_QUESTIONS, 1)
+    ])
+
+
 def main():
     """Main test function"""
     ui = TerminalUI()
@@ -75,63 +160,9 @@ def main():
     # Test each question
     ui.status(f"\n🧪 Teste {len(IDENTITY_TEST_QUESTIONS)} Fragen...\n", "info")
 
-    results = []
-
-    for i, question in enumerate(IDENTITY_TEST_QUESTIONS, 1):
-        print("\n" + "=" * 60)
-        print(f"TEST {i}/{len(IDENTITY_TEST_QUESTIONS)}: {question}")
-        print("=" * 60)
-
-        try:
-            # Generate response
-            response = minimax.generate_response(
-                system_prompt="Du bist SelfAI, ein Multi-Agent System.",
-                user_prompt=question,
-                max_tokens=512
-            )
-
-            print(f"\n📝 RESPONSE:\n{response}\n")
-
-            # Manual validation (response already validated by interface)
-            # But we check again for reporting
-            is_valid_guardrail, violations = guardrail.check(response)
-            is_valid_reflection, reflection_error = reflection_validator.validate(response)
-
-            # Determine result
-            if is_valid_guardrail and is_valid_reflection:
-                result = "✅ PASS"
-                status = "success"
-            elif is_valid_guardrail:
-                result = "⚠️ PASS (Reflexion fehlt)"
-                status = "warning"
-            else:
-                result = "❌ FAIL"
-                status = "error"
-
-            results.append({
-                "question": question,
-                "result": result,
-                "guardrail_valid": is_valid_guardrail,
-                "reflection_valid": is_valid_reflection,
-                "violations": violations if not is_valid_guardrail else [],
-                "reflection_error": reflection_error
-            })
-
-            ui.status(f"{result}: {question}", status)
-
-            if not is_valid_guardrail:
-                ui.status(f"   Violations: {', '.join(violations)}", "error")
-
-            if not is_valid_reflection:
-                ui.status(f"   Reflexion: {reflection_error}", "warning")
-
-        except Exception as e:
-            ui.status(f"❌ ERROR: {e}", "error")
-            results.append({
-                "question": question,
-                "result": "❌ ERROR",
-                "error": str(e)
-            })
+    # Ausgaben der Testläufe schreibt ein Hintergrund-Thread (nur im Terminal)
+    with BackgroundUI(ui) as background_ui:
+        results = asyncio.run(run_all(minimax, background_ui, guardrail, reflection_validator))
 
     # Summary
     print("\n\n" + "=" * 60)
@@ -3,6 +3,9 @@
 from config_loader import load_configuration
 from selfai.core.minimax_interface import MinimaxInterface
 
+# Statischer System-Prompt - nur user_prompt variiert (Provider-Prefix-Caching)
+SYSTEM_PROMPT = "Du bist ein hilfreicher Assistent."
+
 print("╔══════════════════════════════════════════════════╗")
 print("║   SelfAI mit MiniMax - Minimal Test             ║")
 print("╚══════════════════════════════════════════════════╝\n")
@@ -29,7 +32,7 @@ while True:
 
         print("\n🤖 MiniMax denkt...", end='', flush=True)
         response = interface.generate_response(
-            system_prompt="Du bist ein hilfreicher Assistent.",
+            system_prompt=SYSTEM_PROMPT,
             user_prompt=user_input,
             max_tokens=512
         )
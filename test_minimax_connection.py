@@ -2,9 +2,13 @@
 """Test MiniMax API Connectivity with NEW API Key"""
 
 import os
-import requests
+import sys
+import time
+
 from dotenv import load_dotenv
 
+from selfai.core.minimax_interface import create_http_session
+
 # Load environment variables
 load_dotenv()
 
@@ -26,6 +30,9 @@ headers = {
     "Content-Type": "application/json"
 }
 
+# Statischer System-Prompt zuerst, dynamischer Inhalt danach (Prefix-Caching)
+SYSTEM_PROMPT = "You are SelfAI, a helpful assistant."
+
 # Test with correct model name
 model_name = "MiniMax-M2"
 
@@ -36,17 +43,23 @@ print(f"{'='*60}")
 data = {
     "model": model_name,
     "messages": [
-        {"role": "system", "content": "You are SelfAI, a helpful assistant."},
+        {"role": "system", "content": SYSTEM_PROMPT},
         {"role": "user", "content": "Say 'Hello! I am SelfAI powered by MiniMax!' and nothing else."}
     ],
     "max_tokens": 100,
     "temperature": 0.7
 }
 
-print(f"\n🔍 Sending request to {url}")
+# Eine Session für alle Requests: ab Runde 2 entfällt der TCP+TLS Handshake,
+# 429/5xx werden mit Backoff + Jitter wiederholt bevor ein Fehler gemeldet wird
+session = create_http_session()
+# Standard ist ein (kostenpflichtiger) Request; --keepalive schickt einen zweiten
+# hinterher, um die Wiederverwendung der Verbindung an der Round-Trip-Zeit zu zeigen
+ROUNDS = 2 if "--keepalive" in sys.argv[1:] else 1
 
-try:
-    response = requests.post(url, headers=headers, json=data, timeout=30)
+
+def report_response(response):
+    """Wertet eine Antwort aus und gibt True bei Erfolg zurück."""
     print(f"\n📡 Response status: {response.status_code}")
 
     if response.status_code == 200:
@@ -59,8 +72,8 @@ try:
             print(f"\n🎉 🎉 🎉 MiniMax Response:")
             print(f"    {message}")
             print(f"\n✅ Der neue API Key funktioniert perfekt!")
-        else:
-            print(f"⚠️ Unexpected response format: {result}")
+            return True
+        print(f"⚠️ Unexpected response format: {result}")
 
     elif response.status_code == 429:
         print(f"\n❌ RATE LIMIT (429) - IMMER NOCH!")
@@ -79,7 +92,23 @@ try:
         print(f"Status: {response.status_code}")
         print(f"Response: {response.text}")
 
+    return False
+
+
+try:
+    for round_no in range(1, ROUNDS + 1):
+        print(f"\n🔍 Sending request {round_no}/{ROUNDS} to {url}")
+        start = time.perf_counter()
+        response = session.post(url, headers=headers, json=data, timeout=30)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"⏱️  Round-Trip: {elapsed_ms:.0f} ms")
+
+        if not report_response(response):
+            break
+
 except Exception as e:
     print(f"\n❌ ERROR: {e}")
     import traceback
     traceback.print_exc()
+finally:
+    session.close()
@@ -25,9 +25,13 @@ sys.path.insert(0, str(project_root))
 from selfai.ui.ui_adapter import create_ui
 
 
-def simulate_subtask_streaming(ui, subtask_id: str, delay: float = 0.1):
+def simulate_subtask_streaming(ui, subtask_id: str, delay: float = 0.1, start_barrier=None):
     """Simuliert Streaming Output für einen Subtask."""
 
+    # Alle Subtasks starten gleichzeitig (echte Parallelität statt Staffelung)
+    if start_barrier is not None:
+        start_barrier.wait()
+
     # Thinking phase
     thinking_chunks = [
         "Ich analysiere die Anfrage...\n",
@@ -107,16 +111,18 @@ def main():
         ui.start_parallel_view(plan_goal, subtasks_info)
         time.sleep(0.5)  # Let layout render
 
-        # Start subtask threads
+        # Start subtask threads - Barrier gibt alle gleichzeitig frei
+        start_barrier = threading.Barrier(len(subtasks_info) + 1)
         threads = []
-        for i, info in enumerate(subtasks_info):
+        for info in subtasks_info:
             t = threading.Thread(
                 target=simulate_subtask_streaming,
-                args=(ui, info["id"], 0.15)
+                args=(ui, info["id"], 0.15, start_barrier)
             )
             t.start()
             threads.append(t)
-            time.sleep(0.3)  # Stagger start
+
+        start_barrier.wait()
 
         # Wait for completion
         for t in threads:
@@ -5,9 +5,19 @@ Usage: python test_plan_execution.py <plan_file.json>
 """
 
 import sys
-import json
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+except ImportError:  # Fallback: stdlib json
+    import json
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
 # Add selfai to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -35,8 +45,8 @@ def main():
 
     # Load plan
     print(f"📋 Loading plan: {plan_file}")
-    with open(plan_file, 'r', encoding='utf-8') as f:
-        plan_data = json.load(f)
+    with open(plan_file, 'rb') as f:
+        plan_data = _loads(f.read())
 
     goal = plan_data.get("metadata", {}).get("goal", "Unknown goal")
     num_subtasks = len(plan_data.get("subtasks", []))
@@ -3,11 +3,79 @@
 Interactive SelfAI Test - Sends commands programmatically
 """
 
-import subprocess
-import time
+import asyncio
+import os
 import sys
+import time
+from collections import deque
+
+# SelfAI fragt mit "\nDu: " nach der nächsten Eingabe -> Startup bzw. Antwort fertig
+PROMPT_SENTINEL = b"Du: "
+STARTUP_TIMEOUT = 30
+# Nur das Ende der Ausgabe wird behalten (Bytes)
+TAIL_BYTES = 4096
 
-def test_selfai_command(command, timeout=30):
+
+class OutputDrain:
+    """
+    Liest stdout des Child-Prozesses im Hintergrund komplett leer.
+
+    Die Pipe läuft so nie voll (kein Deadlock bei langen Agent-Ausgaben), vom
+    Output bleiben nur die letzten ``TAIL_BYTES`` in einer deque. Gezählt wird,
+    wie oft der Eingabe-Prompt erschienen ist - auch über Chunk-Grenzen hinweg.
+    """
+
+    def __init__(self, stream):
+        self.tail = deque(maxlen=TAIL_BYTES)
+        self.prompts_seen = 0
+        self.eof = False
+        self._changed = asyncio.Condition()
+        self._task = asyncio.create_task(self._drain(stream))
+
+    async def _drain(self, stream):
+        carry = b""
+        while True:
+            chunk = await stream.read(4096)
+            async with self._changed:
+                if not chunk:
+                    self.eof = True
+                    self._changed.notify_all()
+                    return
+                self.tail.extend(chunk)
+                scan = carry + chunk
+                self.prompts_seen += scan.count(PROMPT_SENTINEL)
+                carry = scan[-(len(PROMPT_SENTINEL) - 1):]
+                self._changed.notify_all()
+
+    async def wait_for_prompt(self, count, budget):
+        """Wartet bis ``count`` Prompts gesehen wurden; False wenn das Budget abläuft."""
+        deadline = time.monotonic() + budget
+        async with self._changed:
+            while self.prompts_seen < count:
+                if self.eof:
+                    raise EOFError("SelfAI hat stdout geschlossen")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                try:
+                    await asyncio.wait_for(self._changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return False
+        return True
+
+    async def finish(self, budget):
+        """Wartet auf EOF von stdout und gibt den Tail als Text zurück."""
+        await asyncio.wait_for(asyncio.shield(self._task), budget)
+        return self.text()
+
+    def text(self):
+        return bytes(self.tail).decode(errors="replace")
+
+    def cancel(self):
+        self._task.cancel()
+
+
+async def test_selfai_command(command, timeout=30):
     """
     Test SelfAI with a specific command
     """
@@ -15,37 +83,43 @@ def test_selfai_command(command, timeout=30):
     print(f"🧪 Testing: {command}")
     print("=" * 80)
 
-    # Start SelfAI
-    proc = subprocess.Popen(
-        ["python", "selfai/selfai.py"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1
+    # Start SelfAI (unbuffered, sonst kommt der Prompt erst bei vollem Puffer)
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-u", "selfai/selfai.py",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, "PYTHONUNBUFFERED": "1"},
     )
+    # stdout und stderr parallel leeren, damit der Child-Prozess nie an einer vollen Pipe hängt
+    stdout = OutputDrain(proc.stdout)
+    stderr_task = asyncio.create_task(proc.stderr.read())
 
     try:
-        # Wait a bit for startup
-        time.sleep(3)
+        # Wait for startup (erster Eingabe-Prompt)
+        if not await stdout.wait_for_prompt(1, STARTUP_TIMEOUT):
+            raise TimeoutError(f"SelfAI nicht innerhalb von {STARTUP_TIMEOUT}s gestartet")
 
         # Send command
-        proc.stdin.write(command + "\n")
-        proc.stdin.flush()
+        proc.stdin.write((command + "\n").encode())
+        await proc.stdin.drain()
 
-        # Wait for response
-        time.sleep(timeout)
+        # Wait for response - fertig sobald der nächste Prompt erscheint
+        if not await stdout.wait_for_prompt(2, timeout):
+            print(f"\n⚠️ Keine Antwort innerhalb von {timeout}s")
 
         # Send quit
-        proc.stdin.write("quit\n")
-        proc.stdin.flush()
+        proc.stdin.write(b"quit\n")
+        await proc.stdin.drain()
 
         # Get output
-        stdout, stderr = proc.communicate(timeout=5)
+        output = await stdout.finish(5)
+        await asyncio.wait_for(proc.wait(), 5)
+        stderr = (await stderr_task).decode(errors="replace")
 
         print("\n📤 OUTPUT:")
         print("-" * 80)
-        print(stdout[-2000:])  # Last 2000 chars
+        print(output[-2000:])  # Last 2000 chars
 
         if stderr:
             print("\n❌ ERRORS:")
@@ -55,10 +129,25 @@ def test_selfai_command(command, timeout=30):
         print("\n" + "=" * 80)
 
     except Exception as e:
-        print(f"\n❌ Error: {e}")
-        proc.kill()
+        print(f"\n❌ Error: {e!r}")
+        tail = stdout.text()
+        if tail:
+            print(tail[-2000:])
     finally:
-        proc.terminate()
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        stdout.cancel()
+        stderr_task.cancel()
+
+
+async def main():
+    # Test 1: Simple tool call
+    await test_selfai_command("Say hello!", timeout=20)
+
+    # Test 2: List files
+    # await test_selfai_command("List Python files in selfai/core", timeout=20)
+
 
 if __name__ == "__main__":
     print("""
@@ -71,10 +160,6 @@ if __name__ == "__main__":
 This script tests SelfAI by sending commands programmatically.
 """)
 
-    # Test 1: Simple tool call
-    test_selfai_command("Say hello!", timeout=20)
-
-    # Test 2: List files
-    # test_selfai_command("List Python files in selfai/core", timeout=20)
+    asyncio.run(main())
 
     print("\n✅ Tests completed!")
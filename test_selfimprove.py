@@ -8,6 +8,7 @@ This is the FINAL test - if this works, SelfAI can autonomously improve itself!
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -22,7 +23,6 @@ from config_loader import load_configuration
 from selfai.core.minimax_interface import MinimaxInterface
 from selfai.core.custom_agent_loop import CustomAgentLoop
 from selfai.tools.tool_registry import get_tools_for_agent
-from selfai.ui.terminal_ui import TerminalUI
 
 print("=" * 80)
 print("🚀 FINAL TEST: SELFAI SELF-IMPROVEMENT CAPABILITY")
@@ -36,9 +36,6 @@ print()
 config = load_configuration()
 print("✅ Configuration loaded")
 
-# Initialize UI
-ui = TerminalUI()
-
 # Initialize MiniMax
 api_key = os.getenv('MINIMAX_API_KEY')
 minimax = MinimaxInterface(api_key=api_key)
@@ -52,15 +49,22 @@ print(f"✅ {len(tools)} tools loaded")
 improvement_tools = [t for t in tools if 'improve' in t.name.lower() or 'selfai' in t.name.lower()]
 print(f"\n🔍 Self-improvement related tools found: {[t.name for t in improvement_tools]}")
 
-# Initialize custom agent loop with higher max_steps for self-improvement
-agent = CustomAgentLoop(
-    llm_interface=minimax,
-    tools=tools,
-    max_steps=15,  # Higher limit for complex self-improvement tasks
-    ui=ui,
-    verbose=True,
-)
-print("✅ Custom Agent Loop initialized (max_steps=15)")
+# Agent-Factory: jeder parallele Testfall bekommt eine eigene Instanz ohne UI und
+# ohne verbose - Spinner-Thread und print()-Ausgaben der Agenten würden sich
+# zwischen den Worker-Threads sonst in die Quere kommen. Ausgegeben wird nur im
+# Hauptthread, in der Reihenfolge der Testfälle. MiniMax-Interface und Tools
+# werden geteilt, eine Instanz pro Fall kostet daher nur den System-Prompt.
+def make_agent(max_steps=15):
+    return CustomAgentLoop(
+        llm_interface=minimax,
+        tools=tools,
+        max_steps=max_steps,  # Higher limit for complex self-improvement tasks
+        ui=None,
+        verbose=False,
+    )
+
+
+print("✅ Custom Agent Loop factory ready (max_steps=15, ein Agent pro Testfall)")
 print()
 
 # Test cases for self-improvement
@@ -85,32 +89,39 @@ test_cases = [
     },
 ]
 
-# Run self-improvement tests
-for i, test in enumerate(test_cases, 1):
+
+def run_case(test):
+    """Führt einen Testfall aus; gibt (result, error, traceback) zurück."""
+    try:
+        agent = make_agent()
+        result = agent.run(test['input'], max_steps=test.get('max_steps', 5))
+        return result, None, None
+    except Exception as e:
+        import traceback
+        return None, e, traceback.format_exc()
+
+
+# Run self-improvement tests - unabhängig, daher parallel (Bottleneck ist HTTP)
+with ThreadPoolExecutor(max_workers=len(test_cases)) as ex:
+    futures = {ex.submit(run_case, t): t for t in test_cases}
+    results = {futures[f]['name']: f.result() for f in as_completed(futures)}
+
+# Ausgabe in der ursprünglichen Reihenfolge
+for test in test_cases:
     print("=" * 80)
     print(f"📝 {test['name']}")
     print(f"Input: {test['input']}")
     print(f"Expected: {test['expected']}")
     print("-" * 80)
 
-    try:
-        # Temporarily adjust max_steps for this test
-        original_max_steps = agent.max_steps
-        agent.max_steps = test.get('max_steps', 5)
-
-        result = agent.run(test['input'])
-
-        # Restore max_steps
-        agent.max_steps = original_max_steps
-
+    result, error, tb = results[test['name']]
+    if error is None:
         print(f"\n✅ SUCCESS!")
         print(f"Result: {result[:300]}..." if len(result) > 300 else f"Result: {result}")
-
-    except Exception as e:
+    else:
         print(f"\n❌ FAILED!")
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"Error: {error}")
+        print(tb, end="")
 
     print()
 
@@ -7,65 +7,22 @@ Tests verschiedene Queries um zu sehen ob die Smart Detection
 korrekt zwischen Agent Loop und Simple Response unterscheidet.
 """
 
-# Simuliere die requires_agent_loop Funktion
-def requires_agent_loop(user_input: str) -> bool:
-    """Kopie der Funktion aus selfai.py für Testing"""
-    user_lower = user_input.lower().strip()
-
-    # Commands aktivieren immer Agent (außer /switch, /memory)
-    if user_input.startswith("/") and not user_input.startswith(("/switch", "/memory")):
-        return True
-
-    # Tool-Action Keywords
-    tool_keywords = [
-        "liste", "list", "zeige", "show",
-        "suche", "search", "finde", "find",
-        "erstelle", "create", "schreibe", "write",
-        "führe aus", "execute", "run",
-        "lese", "read", "öffne", "open",
-        "analysiere", "analyze",
-        "teste", "test"
-    ]
-
-    # Self-Introspection Keywords
-    introspection_keywords = [
-        "welche tools", "deine tools", "your tools",
-        "dein code", "your code", "selfai code",
-        "wie funktioniert", "how does", "how do you",
-        "was kannst du", "what can you"
-    ]
-
-    # Multi-Step Indicators
-    multi_step_indicators = [" und ", " and ", " dann ", " danach "]
+import sys
+from pathlib import Path
 
-    # Check für Action Keywords
-    if any(keyword in user_lower for keyword in tool_keywords):
-        return True
-
-    # Check für Self-Introspection
-    if any(keyword in user_lower for keyword in introspection_keywords):
-        return True
-
-    # Check für Multi-Step
-    if any(indicator in user_lower for indicator in multi_step_indicators):
-        return True
-
-    # Einfache Wissensfragen (nicht Agent)
-    simple_patterns = [
-        "was ist", "what is",
-        "erkläre", "explain",
-        "wie geht", "how to",
-        "warum", "why",
-        "hallo", "hi", "hey"
-    ]
+sys.path.insert(0, str(Path(__file__).parent))
 
-    # Wenn kurz UND nur Wissensfrage → kein Agent
-    word_count = len(user_input.split())
-    if word_count < 8 and any(pattern in user_lower for pattern in simple_patterns):
-        return False
-
-    # Default: Bei Unsicherheit KEIN Agent (konservativ)
-    return False
+# Keyword-Listen, Patterns und Entscheidung direkt aus dem Produktionscode -
+# keine eigene Kopie, die unbemerkt auseinanderlaufen kann
+from selfai.selfai import (  # noqa: E402
+    AGENT_INTROSPECTION_KEYWORDS,
+    AGENT_MULTI_STEP_INDICATORS,
+    AGENT_TOOL_KEYWORDS,
+    SIMPLE_QUERY_PATTERNS,
+    _AGENT_LOOP_RE,
+    _SIMPLE_QUERY_RE,
+    requires_agent_loop,
+)
 
 
 # Test Cases
@@ -105,6 +62,21 @@ def run_tests():
     passed = 0
     failed = 0
 
+    # Jedes Keyword der Produktionslisten muss vom zugehörigen Pattern erkannt werden
+    keyword_checks = [
+        (_AGENT_LOOP_RE, AGENT_TOOL_KEYWORDS + AGENT_INTROSPECTION_KEYWORDS + AGENT_MULTI_STEP_INDICATORS),
+        (_SIMPLE_QUERY_RE, SIMPLE_QUERY_PATTERNS),
+    ]
+    for pattern, keywords in keyword_checks:
+        missing = [kw for kw in keywords if not pattern.search(kw)]
+        if missing:
+            failed += 1
+            print(f"❌ FAIL Pattern erkennt Keywords nicht: {missing}")
+        else:
+            passed += 1
+            print(f"✅ PASS Pattern erkennt alle {len(keywords)} Keywords")
+    print()
+
     for query, expected, reason in test_cases:
         result = requires_agent_loop(query)
         status = "✅ PASS" if result == expected else "❌ FAIL"
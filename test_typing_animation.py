@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test: typing_animation bündelt Zeichen pro Write
+================================================
+
+Prüft ohne Terminal und ohne Wartezeit, dass typing_animation beim Default-Delay
+mehrere Zeichen pro Write ausgibt, die Gesamtdauer aber gleich bleibt.
+"""
+
+import contextlib
+import io
+
+import selfai.ui.terminal_ui as terminal_ui
+from selfai.ui.terminal_ui import TerminalUI
+
+
+class RecordingStdout(io.StringIO):
+    """StringIO, das jeden write() einzeln festhält."""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def write(self, text):
+        self.chunks.append(text)
+        return super().write(text)
+
+
+def run_case(text, delay):
+    """Gibt (geschriebene Chunks, geschlafene Sekunden) für einen Aufruf zurück."""
+    slept = []
+    real_sleep = terminal_ui.time.sleep
+    terminal_ui.time.sleep = slept.append
+    out = RecordingStdout()
+    try:
+        with contextlib.redirect_stdout(out):
+            TerminalUI().typing_animation(text, delay=delay)
+    finally:
+        terminal_ui.time.sleep = real_sleep
+    return out.chunks, sum(slept)
+
+
+def run_tests():
+    """Run all test cases and show results"""
+    print("=" * 70)
+    print("TYPING ANIMATION BATCHING - TEST RESULTS")
+    print("=" * 70)
+
+    text = "SelfAI tippt diesen Satz gebündelt." * 3
+    failed = 0
+
+    for delay in (0.02, 0.005, 0.1):
+        chunks, slept = run_case(text, delay)
+        frames = chunks[:-1]  # letzter Write ist der abschließende Zeilenumbruch
+        # Jeder Frame (außer dem Rest am Ende) dauert mindestens _TYPING_FRAME -
+        # oder besteht aus genau einem Zeichen, wenn schon das länger dauert
+        full_frames = frames[:-1]
+        checks = {
+            "Ausgabe vollständig": "".join(chunks) == text + "\n",
+            "Gesamtdauer unverändert": abs(slept - len(text) * delay) < 1e-9,
+            "Frame-Budget eingehalten": all(
+                len(frame) * delay >= TerminalUI._TYPING_FRAME - 1e-9 or len(frame) == 1
+                for frame in full_frames
+            ),
+        }
+        if delay == 0.02:
+            checks["Default bündelt > 1 Zeichen"] = all(len(frame) > 1 for frame in full_frames)
+
+        ok = all(checks.values())
+        failed += not ok
+        status = "✅ PASS" if ok else "❌ FAIL"
+        print(f"{status} delay={delay}: {len(frames)} Writes für {len(text)} Zeichen ({len(text) / len(frames):.1f}/Write)")
+        for name, passed in checks.items():
+            if not passed:
+                print(f"     {name} fehlgeschlagen")
+
+    print("=" * 70)
+    print(f"RESULTS: {3 - failed} passed, {failed} failed")
+    print("=" * 70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_tests()
+    exit(0 if success else 1)
@@ -2,44 +2,325 @@
 """
 Automatische Config-Aktualisierung nach Modell-Download
 """
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import yaml
-from pathlib import Path
+
+# libyaml-Backend wenn verfügbar (Parsen/Schreiben in C)
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Verzeichnisse ohne Modelle - z.B. Lock-/Metadaten-Ordner von huggingface-cli download
+_SKIP = frozenset({".git", "__pycache__", ".cache", ".locks"})
+
+# Dateisysteme mit teurem readdir (Netzwerk/FUSE) - dort wird parallel gescannt
+_NETWORK_FS = frozenset({"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "afs", "ceph", "glusterfs", "lustre"})
+SCAN_WORKERS = 16
+
+# Sidecar-Cache für find_downloaded_model: Ergebnis + mtime jedes durchsuchten Verzeichnisses
+MODEL_CACHE_PATH = ".models_cache.json"
+
+def _iter_gguf(dirpath, dir_mtimes):
+    """Rekursiver scandir-Walk; liefert DirEntry je .gguf-Datei (ohne Path-Objekte)."""
+    try:
+        dir_mtimes[dirpath] = os.stat(dirpath).st_mtime_ns
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP:
+                        yield from _iter_gguf(entry.path, dir_mtimes)
+                elif entry.name.endswith(".gguf"):
+                    yield entry
+    except OSError:
+        # models/ fehlt oder Unterverzeichnis nicht lesbar
+        return
+
+def _scan_dir(dirpath):
+    """Liest ein Verzeichnis komplett (Worker): (mtime_ns, Unterverzeichnisse, gguf-Einträge)."""
+    mtime = os.stat(dirpath).st_mtime_ns
+    subdirs, files = [], []
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(".gguf"):
+                # stat() im Worker, das Ergebnis bleibt im DirEntry gecacht.
+                # Nicht lesbare Einträge (z.B. tote Symlinks) einzeln überspringen,
+                # statt das ganze Verzeichnis zu verwerfen
+                try:
+                    entry.stat()
+                except OSError:
+                    continue
+                files.append(entry)
+    return mtime, subdirs, files
+
+def _iter_gguf_parallel(root, dir_mtimes):
+    """Wie _iter_gguf, aber scandir läuft für alle bekannten Verzeichnisse gleichzeitig im Thread-Pool."""
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        pending = {executor.submit(_scan_dir, root): root}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dirpath = pending.pop(future)
+                try:
+                    mtime, subdirs, files = future.result()
+                except OSError:
+                    continue
+                dir_mtimes[dirpath] = mtime
+                for subdir in subdirs:
+                    pending[executor.submit(_scan_dir, subdir)] = subdir
+                yield from files
+
+def _is_network_fs(path):
+    """Linux: Dateisystemtyp des Mounts von path aus /proc/self/mounts; sonst False (serieller Walk)."""
+    real = os.path.realpath(path)
+    best, fstype = "", None
+    try:
+        with open("/proc/self/mounts", "r") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount = fields[1].replace("\\040", " ")
+                if (real == mount or real.startswith(mount.rstrip("/") + "/")) and len(mount) >= len(best):
+                    best, fstype = mount, fields[2]
+    except OSError:
+        return False
+    return fstype is not None and (fstype in _NETWORK_FS or fstype.startswith("fuse"))
+
+def _load_model_cache():
+    """(path, size) aus dem Sidecar-Cache, solange sich kein durchsuchtes Verzeichnis geändert hat."""
+    try:
+        with open(MODEL_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for dirpath, mtime in data["dirs"].items():
+            if os.stat(dirpath).st_mtime_ns != mtime:
+                return None
+        # Datei in-place überschrieben ändert die Verzeichnis-mtime nicht
+        if os.stat(data["path"]).st_size != data["size"]:
+            return None
+        return data["path"], data["size"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+def _save_model_cache(path, size, dir_mtimes):
+    data = {"path": path, "size": size, "dirs": dir_mtimes}
+    try:
+        write_atomic(MODEL_CACHE_PATH, json.dumps(data).encode("utf-8"))
+    except OSError:
+        pass
 
 def find_downloaded_model():
     """Finde heruntergeladenes GGUF-Modell"""
-    models_dir = Path("models")
+    cached = _load_model_cache()
+    if cached is not None:
+        path, size = cached
+        print(f"✅ Gefunden: {os.path.basename(path)} ({size / (1024*1024):.1f} MB)")
+        return path
     
-    # Suche nach GGUF-Dateien
-    gguf_files = list(models_dir.rglob("*.gguf"))
+    # Wähle größte Datei (meist das Haupt-Modell) - ein Durchlauf, ein stat() je Datei
+    dir_mtimes = {}
+    largest_file = None
+    size = -1
+    walk = _iter_gguf_parallel if _is_network_fs("models") else _iter_gguf
+    for entry in walk("models", dir_mtimes):
+        try:
+            entry_size = entry.stat().st_size
+        except OSError:
+            # Toter Symlink o.ä. - wie im parallelen Walk überspringen
+            continue
+        if entry_size > size:
+            size, largest_file = entry_size, entry
     
-    if not gguf_files:
+    if largest_file is None:
         print("❌ Keine GGUF-Dateien gefunden")
         return None
     
-    # Wähle größte Datei (meist das Haupt-Modell)
-    largest_file = max(gguf_files, key=lambda f: f.stat().st_size)
-    size_mb = largest_file.stat().st_size / (1024*1024)
+    _save_model_cache(largest_file.path, size, dir_mtimes)
+    size_mb = size / (1024*1024)
     
     print(f"✅ Gefunden: {largest_file.name} ({size_mb:.1f} MB)")
-    return str(largest_file)
+    return largest_file.path
+
+def write_atomic(path, data):
+    """Schreibt data komplett in eine Temp-Datei, fsync, und ersetzt path atomar."""
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=f".{name}.", suffix=".tmp")
+    try:
+        # fdopen/write schreibt bei kurzen Writes nach; fsync vor dem Rename, damit
+        # nach einem Stromausfall nicht die neue (leere) Datei übrig bleibt
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp legt 0600 an - Rechte der bestehenden Datei übernehmen
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    # Den Rename selbst dauerhaft machen (POSIX; unter Windows nicht möglich)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory or ".", os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+_CPU_FALLBACK_RE = re.compile(r"cpu_fallback:\s*(#.*)?")
+_BLOCK_KEY_RE = re.compile(r"([ \t]+)([A-Za-z_]\w*):")
+_COMMENT_RE = re.compile(r"[ \t]+#.*")
+_QUOTED_RE = {
+    '"': re.compile(r'"(?:[^"\\]|\\.)*"'),
+    "'": re.compile(r"'(?:[^']|'')*'"),
+}
+
+def _trailing_comment(rest):
+    """
+    Kommentar (inkl. führendem Whitespace) hinter einem einzeiligen Skalar.
+
+    Gibt None zurück, wenn der Wert nicht sicher als einzeiliger Skalar
+    ersetzt werden kann (leer, Block-Skalar, Anker/Tag/Alias, Flow-Collection,
+    mehrzeiliger Quoted-String).
+    """
+    value = rest.lstrip(" \t")
+    if not value or value[0] in "|>&*![{#":
+        return None
+    if value[0] in _QUOTED_RE:
+        quoted = _QUOTED_RE[value[0]].match(value)
+        if quoted is None:
+            return None
+        after = value[quoted.end():]
+        comment = _COMMENT_RE.match(after)
+        if comment is None and after.strip():
+            return None
+        return after if comment else ""
+    comment = _COMMENT_RE.search(value)
+    return comment.group(0) if comment else ""
+
+def patch_cpu_fallback(text, values):
+    """
+    Ersetzt die Zeilen der Schlüssel in ``values`` direkt im cpu_fallback-Block.
+
+    Trailing-Kommentare der Zeilen bleiben erhalten. Gibt None zurück, wenn
+    der Block fehlt, nicht alle Schlüssel darin stehen oder ein Wert über
+    mehrere Zeilen geht - dann wird der Block per splice_cpu_fallback neu
+    geschrieben.
+    """
+    lines = text.splitlines(keepends=True)
+    start = next((i for i, line in enumerate(lines) if _CPU_FALLBACK_RE.fullmatch(line.rstrip("\r\n"))), None)
+    if start is None:
+        return None
+
+    indent = None
+    found = set()
+    for i in range(start + 1, len(lines)):
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        match = _BLOCK_KEY_RE.match(line)
+        if match is None:
+            # Nächster Top-Level-Schlüssel -> Blockende
+            if not line[0].isspace():
+                break
+            continue
+        if indent is None:
+            indent = match.group(1)
+        key = match.group(2)
+        if match.group(1) == indent and key in values:
+            content = line.rstrip("\r\n")
+            comment = _trailing_comment(content[match.end():])
+            if comment is None or _continues(lines, i, len(indent)):
+                return None
+            newline = line[len(content):]
+            # JSON-Skalare sind gültiges YAML (Strings doppelt gequotet)
+            lines[i] = f"{indent}{key}: {json.dumps(values[key], ensure_ascii=False)}{comment}{newline}"
+            found.add(key)
+
+    if found != set(values):
+        return None
+    return "".join(lines)
+
+def _continues(lines, index, indent_width):
+    """True, wenn die nächste Inhaltszeile tiefer eingerückt ist (Wert geht weiter)."""
+    for line in lines[index + 1:]:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        return len(line) - len(line.lstrip(" \t")) > indent_width
+    return False
+
+def splice_cpu_fallback(text, values):
+    """
+    Schreibt nur den cpu_fallback-Block neu und setzt ihn an derselben Stelle ein.
+
+    Fehlt der Block, wird er angehängt. Der restliche Text (inkl. Kommentare)
+    bleibt unverändert. Gibt None zurück, wenn der Block kein Mapping ist.
+    """
+    lines = text.splitlines(keepends=True)
+    start = next((i for i, line in enumerate(lines) if line.startswith("cpu_fallback:")), None)
+    if start is None:
+        section = {}
+        start = end = len(lines)
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+    else:
+        # Block = eingerückte bzw. leere Folgezeilen, ohne abschließende Leerzeilen
+        end = start + 1
+        while end < len(lines) and (lines[end][:1] in (" ", "\t") or not lines[end].strip()):
+            end += 1
+        while end > start + 1 and not lines[end - 1].strip():
+            end -= 1
+        try:
+            section = yaml.load("".join(lines[start:end]), Loader=SafeLoader)["cpu_fallback"] or {}
+        except (yaml.YAMLError, TypeError, KeyError):
+            return None
+        if not isinstance(section, dict):
+            return None
+
+    section.update(values)
+    block = yaml.dump({"cpu_fallback": section}, Dumper=SafeDumper,
+                      default_flow_style=False, allow_unicode=True, sort_keys=False)
+    return "".join(lines[:start]) + block + "".join(lines[end:])
 
 def update_config(model_path):
     """Aktualisiere config.yaml"""
     try:
         with open("config.yaml", "r") as f:
-            config = yaml.safe_load(f)
+            text = f.read()
         
         # Aktualisiere CPU-Fallback
-        if "cpu_fallback" not in config:
-            config["cpu_fallback"] = {}
+        values = {
+            "model_path": model_path,
+            "n_ctx": 2048,  # Kontext-Größe
+            "n_gpu_layers": 0,  # CPU-only
+        }
         
-        config["cpu_fallback"]["model_path"] = model_path
-        config["cpu_fallback"]["n_ctx"] = 2048  # Kontext-Größe
-        config["cpu_fallback"]["n_gpu_layers"] = 0  # CPU-only
+        # Fast Path: Schlüssel existieren schon -> nur die drei Zeilen ersetzen, kein YAML-Parse.
+        # Sonst nur den cpu_fallback-Block neu schreiben.
+        data = patch_cpu_fallback(text, values)
+        if data is None:
+            data = splice_cpu_fallback(text, values)
+        if data is None:
+            config = yaml.load(text, Loader=SafeLoader)
+            config.setdefault("cpu_fallback", {}).update(values)
+            data = yaml.dump(config, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
         
         # Speichere Config
-        with open("config.yaml", "w") as f:
-            yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+        write_atomic("config.yaml", data.encode("utf-8"))
         
         print(f"✅ config.yaml aktualisiert!")
         print(f"   Modell-Pfad: {model_path}")